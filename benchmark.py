@@ -0,0 +1,381 @@
+import argparse
+import io
+import json
+import statistics
+import sys
+import time
+import typing
+from copy import deepcopy
+from dataclasses import dataclass
+
+from calculator import get_setl_totals, get_player_totals
+from catalogue import Namer, BLESSINGS, IMPROVEMENTS, UNIT_PLANS, get_default_unit, get_heathen
+from game_state import GameState
+from models import GameConfig, Faction, Settlement, Unit
+from movemaker import set_construction, set_blessing
+
+if typing.TYPE_CHECKING:
+    from renderer import HeadlessBackend
+    from resource_manager import ResourceManager
+
+# The seed used to generate every fixture, so that each run measures exactly the same states.
+FIXTURE_SEED = 0
+# The number of times each benchmark is run for each fixture. The best of these is compared against baselines.
+DEFAULT_REPEATS = 3
+# The fraction by which a benchmark may be slower than its baseline before it is flagged as a regression.
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class FixtureSize:
+    """
+    The make-up of a synthetic game state to benchmark against.
+    """
+    players: int
+    settlements: int
+    units: int  # Deployed units, in addition to the one garrisoned in each settlement.
+    heathens: int
+    blessings: int  # The number of blessings each player has undergone.
+    turn: int
+
+
+# The synthetic game states benchmarked, from a handful of players just starting out to a crowded late game.
+FIXTURES: typing.Dict[str, FixtureSize] = {
+    "early": FixtureSize(4, 12, 20, 5, 0, 20),
+    "mid": FixtureSize(8, 120, 500, 60, 6, 150),
+    "late": FixtureSize(14, 500, 2000, 300, 15, 400)
+}
+
+# The number of times each screen is drawn in a single run of the draw benchmark.
+DRAWN_FRAMES = 10
+
+# A benchmark is given a copy of the fixture to set up with, and returns the function to time.
+Benchmark = typing.Callable[[GameState], typing.Callable[[], typing.Any]]
+
+
+def build_fixture(size: FixtureSize) -> GameState:
+    """
+    Build a synthetic AI-only game state of the given size, as if a game had been played up to the given turn.
+    :param size: The make-up of the state.
+    :return: The built state.
+    """
+    state = GameState(GameConfig(size.players, Faction.AGRICULTURISTS, True, True, True, FIXTURE_SEED), Namer())
+    state.gen_players(ai_only=True)
+    state.turn = size.turn
+    rng = state.rng
+    for player in state.players:
+        player.wealth = rng.uniform(0, 1000)
+        player.blessings = rng.sample(list(BLESSINGS.values()), size.blessings)
+
+    # Settlements are spread out so that no two share a quad.
+    for idx, loc_idx in enumerate(rng.sample(range(100 * 90), size.settlements)):
+        player = state.players[idx % size.players]
+        location = loc_idx % 100, loc_idx // 100
+        quad = state.quads[location[1]][location[0]]
+        name = state.namer.get_settlement_name(quad.biome, rng)
+        setl = Settlement(name, location, [], [quad], [get_default_unit(location)])
+        setl.level = rng.randint(1, 10)
+        setl.satisfaction = rng.uniform(0, 100)
+        available_imps = [imp for imp in IMPROVEMENTS if imp.prereq is None or imp.prereq in player.blessings]
+        setl.improvements = rng.sample(available_imps, min(setl.level, len(available_imps)))
+        player.settlements.append(setl)
+
+    # Settlers are left out, as moving them founds new settlements, which would change the fixture between runs.
+    plans = [plan for plan in UNIT_PLANS if not plan.can_settle]
+    for idx in range(size.units):
+        player = state.players[idx % size.players]
+        plan = deepcopy(rng.choice(plans))
+        player.units.append(Unit(plan.max_health, plan.total_stamina, (rng.randint(0, 99), rng.randint(0, 89)),
+                                 False, plan))
+    for _ in range(size.heathens):
+        state.heathens.append(get_heathen((rng.randint(0, 99), rng.randint(0, 89)), size.turn))
+    state.spatial_index.rebuild(state.players, state.heathens)
+    return state
+
+
+def bench_setl_totals(state: GameState) -> typing.Callable[[], None]:
+    """
+    Calculate the totals for every settlement.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    def run():
+        for player in state.players:
+            for setl in player.settlements:
+                get_setl_totals(player, setl, False)
+    return run
+
+
+def bench_player_totals(state: GameState) -> typing.Callable[[], None]:
+    """
+    Calculate the totals for every player.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    def run():
+        for player in state.players:
+            get_player_totals(player, False)
+    return run
+
+
+def bench_set_construction(state: GameState) -> typing.Callable[[], None]:
+    """
+    Choose a construction for every settlement.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    def run():
+        for player in state.players:
+            for setl in player.settlements:
+                set_construction(player, setl, False)
+    return run
+
+
+def bench_set_blessing(state: GameState) -> typing.Callable[[], None]:
+    """
+    Choose a blessing for every player.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    all_totals = [get_player_totals(player, False) for player in state.players]
+
+    def run():
+        for player, player_totals in zip(state.players, all_totals):
+            set_blessing(player, player_totals)
+    return run
+
+
+def bench_move_unit(state: GameState) -> typing.Callable[[], None]:
+    """
+    Move every deployed unit once, as the AI players would.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    # Whether each player is under threat is worked out once for all of their units, as in MoveMaker.make_move().
+    under_threat = [any(setl.under_siege_by is not None or setl.strength < setl.max_strength / 2
+                        for setl in player.settlements) for player in state.players]
+
+    def run():
+        for player, threatened in zip(state.players, under_threat):
+            # Each player's units follow their own roaming field, so that of the previous player is cleared, as it is at
+            # the start of MoveMaker.make_move().
+            state.move_maker.roaming_field = None
+            for unit in list(player.units):
+                state.move_maker.move_unit(player, unit, state.players, threatened, state.game_config)
+    return run
+
+
+def bench_process_heathens(state: GameState) -> typing.Callable[[], None]:
+    """
+    Process the turns for every heathen.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    return state.process_heathens
+
+
+def bench_check_for_victory(state: GameState) -> typing.Callable[[], None]:
+    """
+    Check every player for victories.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    return state.check_for_victory
+
+
+def bench_play_turn(state: GameState) -> typing.Callable[[], None]:
+    """
+    Play a whole turn, from the end of the turn through to every AI's move. Fixtures can already meet the conditions
+    for a victory, so heathens and AIs move regardless.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    return lambda: state.play_turn(stop_at_victory=False)
+
+
+def bench_generate_quads(state: GameState) -> typing.Callable[[], None]:
+    """
+    Generate a new board of quads.
+    :param state: The state to benchmark against. Only its config and random number generator are used.
+    :return: The function to time.
+    """
+    return state.generate_quads
+
+
+def bench_save(state: GameState) -> typing.Callable[[], None]:
+    """
+    Save the state, to memory rather than to disk so that only the encoding is measured.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    return lambda: state.save(io.StringIO())
+
+
+def bench_load(state: GameState) -> typing.Callable[[], None]:
+    """
+    Load the state from a save held in memory.
+    :param state: The state to benchmark against.
+    :return: The function to time.
+    """
+    save_file = io.StringIO()
+    state.save(save_file)
+    save = save_file.getvalue()
+    return lambda: GameState.load(io.StringIO(save), Namer())
+
+
+# The images drawn by the draw benchmark, loaded the first time it is run.
+_resources: typing.Optional["ResourceManager"] = None
+
+
+def bench_draw(state: GameState) -> typing.Callable[[], "HeadlessBackend"]:
+    """
+    Record the drawing of the board by day and by night, with the standard overlay shown, and of the menu, measuring
+    each frame with a HeadlessBackend rather than drawing it to the screen. pyxel still needs to be initialised for the
+    images to be loaded, so its modules are only imported here, leaving the other benchmarks free to run without it.
+    :param state: The state to benchmark against.
+    :return: The function to time, which returns the backend that measured the frames.
+    """
+    global _resources
+    import pyxel
+    from board import Board
+    from menu import Menu
+    from renderer import Renderer, HeadlessBackend, SCREEN_WIDTH, SCREEN_HEIGHT
+    from resource_manager import ResourceManager
+
+    if _resources is None:
+        pyxel.init(SCREEN_WIDTH, SCREEN_HEIGHT, title="Microcosm benchmark", quit_key=pyxel.KEY_NONE)
+        _resources = ResourceManager()
+    board = Board(state, _resources)
+    board.overlay.current_player = state.players[0]
+    board.overlay.toggle_standard(state.turn)
+    menu = Menu(_resources)
+    renderer = Renderer()
+    # The map is centred on the first player's first settlement, as it would be when starting their turn.
+    centre = state.players[0].settlements[0].location if state.players[0].settlements else (50, 45)
+    map_pos = min(max(centre[0] - 12, 0), 76), min(max(centre[1] - 11, 0), 68)
+
+    def run() -> HeadlessBackend:
+        backend = HeadlessBackend()
+        for _ in range(DRAWN_FRAMES):
+            for is_night in (False, True):
+                backend.measure(renderer, lambda: board.draw(renderer, state.players, map_pos, state.turn, is_night,
+                                                             state.until_night))
+            backend.measure(renderer, lambda: menu.draw(renderer))
+        return backend
+    return run
+
+
+# Every benchmark run against each fixture, by name.
+BENCHMARKS: typing.Dict[str, Benchmark] = {
+    "get_setl_totals": bench_setl_totals,
+    "get_player_totals": bench_player_totals,
+    "set_construction": bench_set_construction,
+    "set_blessing": bench_set_blessing,
+    "move_unit": bench_move_unit,
+    "process_heathens": bench_process_heathens,
+    "check_for_victory": bench_check_for_victory,
+    "play_turn": bench_play_turn,
+    "generate_quads": bench_generate_quads,
+    "save_game": bench_save,
+    "load_game": bench_load,
+    "draw": bench_draw
+}
+# The benchmarks whose functions return the HeadlessBackend that measured their drawing, so that the time spent
+# recording commands can be reported along with what was drawn.
+DRAW_BENCHMARKS = {"draw"}
+
+
+def run_benchmarks(fixture_names: typing.List[str],
+                   repeats: int) -> typing.Dict[str, typing.Dict[str, typing.Dict[str, float]]]:
+    """
+    Run every benchmark against each of the given fixtures. Each run is given its own copy of the fixture, so that
+    benchmarks which change the state, such as moving units, measure the same work every time.
+    :param fixture_names: The names of the fixtures to run against.
+    :param repeats: The number of times to run each benchmark.
+    :return: The best and median times, in seconds, for each benchmark, by fixture. Benchmarks that draw also have the
+    number of each type of command drawn per frame, and the overdraw.
+    """
+    results = {}
+    for fixture_name in fixture_names:
+        fixture = build_fixture(FIXTURES[fixture_name])
+        results[fixture_name] = {}
+        for bench_name, benchmark in BENCHMARKS.items():
+            times = []
+            backend = None
+            for _ in range(repeats):
+                run = benchmark(deepcopy(fixture))
+                start = time.perf_counter()
+                result = run()
+                backend = result if bench_name in DRAW_BENCHMARKS else None
+                # Only the time spent recording the commands counts for drawing, not the time spent counting them.
+                times.append(time.perf_counter() - start if backend is None else backend.draw_time)
+            results[fixture_name][bench_name] = {"best": min(times), "median": statistics.median(times)}
+            print(f"  {fixture_name + '/' + bench_name:<26}{min(times) * 1000:>10.3f} ms", flush=True)
+            if backend is not None:
+                # Every run draws the same frames, so the counts from the last run stand for all of them.
+                op_counts = {operation.value: count / backend.frames for operation, count in backend.op_counts.items()}
+                results[fixture_name][bench_name]["op_counts"] = op_counts
+                results[fixture_name][bench_name]["overdraw"] = backend.get_overdraw()
+                print(f"    {backend.get_overdraw():.2f}x overdraw, per frame: " +
+                      ", ".join(f"{count:.0f} {op}" for op, count in sorted(op_counts.items())), flush=True)
+    return results
+
+
+def compare(results: typing.Dict[str, typing.Dict[str, typing.Dict[str, float]]],
+            baseline: typing.Dict[str, typing.Dict[str, typing.Dict[str, float]]], threshold: float) -> int:
+    """
+    Print how each benchmark's best time compares to its baseline, flagging any that have regressed.
+    :param results: The results of this run.
+    :param baseline: The results of a previous run.
+    :param threshold: The fraction by which a benchmark may be slower than its baseline before it is flagged.
+    :return: The number of regressions found.
+    """
+    regressions = 0
+    print(f"{'Benchmark':<28}{'Baseline':>12}{'Current':>12}{'Change':>9}")
+    for fixture_name, fixture_results in results.items():
+        for bench_name, result in fixture_results.items():
+            # Benchmarks added since the baseline was saved have nothing to compare against.
+            if bench_name not in baseline.get(fixture_name, {}):
+                continue
+            before = baseline[fixture_name][bench_name]["best"]
+            after = result["best"]
+            change = (after - before) / before if before > 0 else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{fixture_name + '/' + bench_name:<28}{before * 1000:>10.3f}ms{after * 1000:>10.3f}ms"
+                  f"{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main():
+    """
+    Run the benchmarks, then save the results as a baseline or compare them against one, as requested.
+    """
+    parser = argparse.ArgumentParser(description="Time the turn-processing hot paths of Microcosm.")
+    parser.add_argument("--fixtures", nargs="+", choices=list(FIXTURES), default=list(FIXTURES),
+                        help="fixtures to run against")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="runs of each benchmark")
+    parser.add_argument("--save", metavar="BASELINE", help="save the results as a baseline to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results against this baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fraction slower than the baseline that counts as a regression")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.fixtures, args.repeats)
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Saved baseline to {args.save}.")
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions > 0:
+            print(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
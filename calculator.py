@@ -6,10 +6,11 @@ from models import Biome, Unit, Heathen, AttackData, Player, EconomicStatus, Har
     UnitPlan, SetlAttackData, GameConfig, InvestigationResult, Faction, Project, ProjectType
 
 
-def calculate_yield_for_quad(biome: Biome) -> (float, float, float, float):
+def calculate_yield_for_quad(biome: Biome, rng: random.Random) -> (float, float, float, float):
     """
     Given the supplied biome, generate a random yield to be used for a quad.
     :param biome: The biome of the quad-to-be.
+    :param rng: The game's random number generator.
     :return: A tuple of wealth, harvest, zeal, and fortune.
     """
     wealth: float = 0
@@ -18,25 +19,25 @@ def calculate_yield_for_quad(biome: Biome) -> (float, float, float, float):
     fortune: float = 0
 
     if biome is Biome.FOREST:
-        wealth = random.uniform(0.0, 2.0)
-        harvest = random.uniform(5.0, 9.0)
-        zeal = random.uniform(1.0, 4.0)
-        fortune = random.uniform(3.0, 6.0)
+        wealth = rng.uniform(0.0, 2.0)
+        harvest = rng.uniform(5.0, 9.0)
+        zeal = rng.uniform(1.0, 4.0)
+        fortune = rng.uniform(3.0, 6.0)
     elif biome is Biome.SEA:
-        wealth = random.uniform(1.0, 4.0)
-        harvest = random.uniform(3.0, 6.0)
-        zeal = random.uniform(0.0, 1.0)
-        fortune = random.uniform(5.0, 9.0)
+        wealth = rng.uniform(1.0, 4.0)
+        harvest = rng.uniform(3.0, 6.0)
+        zeal = rng.uniform(0.0, 1.0)
+        fortune = rng.uniform(5.0, 9.0)
     elif biome is Biome.DESERT:
-        wealth = random.uniform(5.0, 9.0)
-        harvest = random.uniform(0.0, 1.0)
-        zeal = random.uniform(3.0, 6.0)
-        fortune = random.uniform(1.0, 4.0)
+        wealth = rng.uniform(5.0, 9.0)
+        harvest = rng.uniform(0.0, 1.0)
+        zeal = rng.uniform(3.0, 6.0)
+        fortune = rng.uniform(1.0, 4.0)
     elif biome is Biome.MOUNTAIN:
-        wealth = random.uniform(3.0, 6.0)
-        harvest = random.uniform(1.0, 4.0)
-        zeal = random.uniform(5.0, 9.0)
-        fortune = random.uniform(0.0, 2.0)
+        wealth = rng.uniform(3.0, 6.0)
+        harvest = rng.uniform(1.0, 4.0)
+        zeal = rng.uniform(5.0, 9.0)
+        fortune = rng.uniform(0.0, 2.0)
 
     return wealth, harvest, zeal, fortune
 
@@ -218,7 +219,8 @@ def complete_construction(setl: Settlement, player: Player):
     setl.current_work = None
 
 
-def investigate_relic(player: Player, unit: Unit, relic_loc: (int, int), cfg: GameConfig) -> InvestigationResult:
+def investigate_relic(player: Player, unit: Unit, relic_loc: (int, int), cfg: GameConfig,
+                      rng: random.Random) -> InvestigationResult:
     """
     Investigate a relic with the given unit.
     Possible rewards include:
@@ -234,9 +236,10 @@ def investigate_relic(player: Player, unit: Unit, relic_loc: (int, int), cfg: Ga
     :param relic_loc: The location of the relic.
     :param cfg: The game configuration, used to determine whether to grant vision bonuses, which are useless when fog of
     war is disabled.
+    :param rng: The game's random number generator.
     :return: The type of investigation result, i.e. the bonus granted, if there is one.
     """
-    random_chance = random.randint(0, 100)
+    random_chance = rng.randint(0, 100)
     # Scrutineers always succeed when investigating.
     was_successful = True if player.faction is Faction.SCRUTINEERS else random_chance < 70
     if was_successful:
@@ -247,9 +250,7 @@ def investigate_relic(player: Player, unit: Unit, relic_loc: (int, int), cfg: Ga
             player.wealth += 25
             return InvestigationResult.WEALTH
         if random_chance < 30 and cfg.fog_of_war:
-            for i in range(relic_loc[1] - 10, relic_loc[1] + 11):
-                for j in range(relic_loc[0] - 10, relic_loc[0] + 11):
-                    player.quads_seen.add((j, i))
+            player.quads_seen.stamp(relic_loc, 10)
             return InvestigationResult.VISION
         if random_chance < 40:
             unit.plan.max_health += 5
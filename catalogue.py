@@ -2,8 +2,6 @@ import random
 import typing
 from copy import deepcopy
 
-import pyxel
-
 from models import Player, Improvement, ImprovementType, Effect, Blessing, Settlement, UnitPlan, Unit, Biome, Heathen, \
     Faction, Project, ProjectType
 
@@ -44,13 +42,18 @@ class Namer:
     def __init__(self):
         self.names = deepcopy(SETL_NAMES)
 
-    def get_settlement_name(self, biome: Biome) -> str:
+    def get_settlement_name(self, biome: Biome, rng: random.Random) -> str:
         """
         Returns a settlement name for the given biome.
         :param biome: The biome of the settlement-to-be.
+        :param rng: The game's random number generator.
         :return: A settlement name.
         """
-        name = random.choice(self.names[biome])
+        # Once every name for the biome has been used, names are reused, as a game that lasts long enough can have more
+        # settlements in a biome than there are names for it.
+        if not self.names[biome]:
+            self.names[biome] = deepcopy(SETL_NAMES[biome])
+        name = rng.choice(self.names[biome])
         # Note that we remove the settlement name to avoid duplicates.
         self.names[biome].remove(name)
         return name
@@ -61,6 +64,10 @@ class Namer:
         :param name: The settlement name to remove.
         :param biome: The biome of the settlement. Used to locate the name in the dictionary.
         """
+        # Names are reused once every name for the biome has been taken, so a game can have more than one settlement
+        # with the same name. Any after the first were named from a fresh set of names, so the same is done here.
+        if name not in self.names[biome]:
+            self.names[biome] = deepcopy(SETL_NAMES[biome])
         self.names[biome].remove(name)
 
     def reset(self):
@@ -199,21 +206,23 @@ UNIT_PLANS = [
 ]
 
 
+# The colour of each faction. These are pyxel's colour indices, given as numbers so that the game logic can run without
+# pyxel.
 FACTION_COLOURS: typing.Dict[Faction, int] = {
-    Faction.AGRICULTURISTS: pyxel.COLOR_GREEN,
-    Faction.CAPITALISTS: pyxel.COLOR_YELLOW,
-    Faction.SCRUTINEERS: pyxel.COLOR_LIGHT_BLUE,
-    Faction.GODLESS: pyxel.COLOR_CYAN,
-    Faction.RAVENOUS: pyxel.COLOR_LIME,
-    Faction.FUNDAMENTALISTS: pyxel.COLOR_ORANGE,
-    Faction.ORTHODOX: pyxel.COLOR_PURPLE,
-    Faction.CONCENTRATED: pyxel.COLOR_GRAY,
-    Faction.FRONTIERSMEN: pyxel.COLOR_PEACH,
-    Faction.IMPERIALS: pyxel.COLOR_DARK_BLUE,
-    Faction.PERSISTENT: pyxel.COLOR_RED,
-    Faction.EXPLORERS: pyxel.COLOR_PINK,
-    Faction.INFIDELS: pyxel.COLOR_BROWN,
-    Faction.NOCTURNE: pyxel.COLOR_NAVY
+    Faction.AGRICULTURISTS: 3,  # Green
+    Faction.CAPITALISTS: 10,  # Yellow
+    Faction.SCRUTINEERS: 6,  # Light Blue
+    Faction.GODLESS: 12,  # Cyan
+    Faction.RAVENOUS: 11,  # Lime
+    Faction.FUNDAMENTALISTS: 9,  # Orange
+    Faction.ORTHODOX: 2,  # Purple
+    Faction.CONCENTRATED: 13,  # Gray
+    Faction.FRONTIERSMEN: 15,  # Peach
+    Faction.IMPERIALS: 5,  # Dark Blue
+    Faction.PERSISTENT: 8,  # Red
+    Faction.EXPLORERS: 14,  # Pink
+    Faction.INFIDELS: 4,  # Brown
+    Faction.NOCTURNE: 1  # Navy
 }
 
 
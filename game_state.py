@@ -0,0 +1,758 @@
+import json
+import random
+import time
+import typing
+from collections import Counter
+from itertools import chain
+
+from calculator import clamp, attack, get_setl_totals, complete_construction, calculate_yield_for_quad
+from catalogue import get_heathen, get_default_unit, Namer, FACTION_COLOURS, get_blessing, get_improvement, \
+    get_project
+from metrics import TurnMetrics
+from models import Player, Settlement, CompletedConstruction, Unit, HarvestStatus, EconomicStatus, Heathen, \
+    AttackPlaystyle, GameConfig, Biome, Victory, VictoryType, AIPlaystyle, ExpansionPlaystyle, Faction, Project, \
+    Quad, Notification, NotificationType, UnitPlan, Blessing, ENTITY_IDS
+from movemaker import MoveMaker
+from pathing import DistanceField
+from save_encoder import SaveEncoder, ObjectConverter
+from seen_quads import SeenQuads
+from spatial_index import SpatialIndex, RelicIndex
+from tracing import Tracer
+
+
+class GameState:
+    """
+    The class responsible for the state of a game in progress, and the turn logic that advances it. Nothing here draws,
+    plays audio, or touches the overlay, so turns can be run without a window. Anything the non-AI player should be
+    shown is instead reported as a notification, for the game to display as it sees fit.
+    """
+    def __init__(self, cfg: GameConfig, namer: Namer, quads: typing.List[typing.List[Quad]] = None):
+        """
+        Initialises the state with the given config and quads, if supplied.
+        :param cfg: The game config.
+        :param namer: The Namer instance to use for settlement names.
+        :param quads: The quads loaded in, if we are loading a game.
+        """
+        self.game_config: GameConfig = cfg
+        self.namer: Namer = namer
+        # Every random outcome in the game comes from this generator, so that the same seed and the same moves always
+        # play out the same way. A seed is chosen if the config has none, so that it can still be saved.
+        if cfg.seed is None:
+            cfg.seed = random.randrange(2 ** 32)
+        self.rng = random.Random(cfg.seed)
+        # We allow quads to be supplied here in load game cases.
+        if quads is not None:
+            self.quads = quads
+        else:
+            self.quads: typing.List[typing.List[typing.Optional[Quad]]] = [[None] * 100 for _ in range(90)]
+            self.generate_quads()
+        # Keep track of where the relics are, so that AI units need not search the quads around them for one.
+        self.relics = RelicIndex()
+        self.relics.rebuild(self.quads)
+        # The distance to the nearest relic from every quad, shared by every AI player's units. Only calculated when
+        # first needed after a relic has been investigated.
+        self.relic_field: typing.Optional[DistanceField] = None
+        self.players: typing.List[Player] = []
+        self.heathens: typing.List[Heathen] = []
+        self.turn = 1
+        # There will always be a 10-20 turn break between nights.
+        self.until_night: int = self.rng.randint(10, 20)
+        # Also keep track of how many turns of night are left. If this is 0, it is daytime.
+        self.nighttime_left = 0
+        # Keep track of where everything is. Anything displaying the game can listen to the grids for changes.
+        self.spatial_index = SpatialIndex()
+        # Functions to call with the coordinates of each relic that is investigated, e.g. to redraw its quad.
+        self.relic_listeners: typing.List[typing.Callable[[int, int], None]] = []
+        self.notifications: typing.List[Notification] = []
+        self.move_maker = MoveMaker(namer)
+        self.move_maker.state_ref = self
+        # Records where the time taken to process each turn goes, but only once started.
+        self.tracer = Tracer()
+        # A time series of each player's statistics, recorded at the end of every turn.
+        self.metrics = TurnMetrics()
+
+    def notify(self, notification_type: NotificationType, *args):
+        """
+        Report something that the non-AI player may need to be shown.
+        :param notification_type: The type of notification.
+        :param args: The data required to display the notification.
+        """
+        self.notifications.append(Notification(notification_type, args))
+
+    def take_notifications(self) -> typing.List[Notification]:
+        """
+        Take the notifications reported since this was last called.
+        :return: The notifications, in the order they were reported.
+        """
+        notifications = self.notifications
+        self.notifications = []
+        return notifications
+
+    def remove_relic(self, x: int, y: int):
+        """
+        Remove the relic at the given location, letting any listeners know.
+        :param x: The X coordinate of the relic.
+        :param y: The Y coordinate of the relic.
+        """
+        self.quads[y][x].is_relic = False
+        self.relics.remove((x, y))
+        # The field is updated as a copy, as the aggressive AI players' fields are combined from the current one, and
+        # only combined again once it has been replaced.
+        if self.relic_field is not None:
+            self.relic_field = self.relic_field.copy()
+            self.relic_field.remove_goals_near((x, y), 1)
+        for listener in self.relic_listeners:
+            listener(x, y)
+
+    def get_relic_field(self) -> DistanceField:
+        """
+        Get the distance to the nearest relic from every quad, calculating it the first time it is needed. From then on,
+        it is updated as relics are investigated.
+        :return: The distance field for the relics.
+        """
+        if self.relic_field is None:
+            self.relic_field = DistanceField(self.relics.get_all())
+        return self.relic_field
+
+    def gen_players(self, ai_only: bool = False):
+        """
+        Generates the players for the game based on the config.
+        :param ai_only: Whether the player choosing the faction in the config should also be an AI, e.g. when
+        simulating games.
+        """
+        cfg = self.game_config
+        self.players = [Player("The Chosen One", cfg.player_faction, FACTION_COLOURS[cfg.player_faction],
+                               0, [], [], [], SeenQuads(), set())]
+        if ai_only:
+            self.players[0].ai_playstyle = AIPlaystyle(self.rng.choice(list(AttackPlaystyle)),
+                                                       self.rng.choice(list(ExpansionPlaystyle)))
+        factions = list(Faction)
+        # Ensure that an AI player doesn't choose the same faction as the player.
+        factions.remove(cfg.player_faction)
+        for i in range(1, cfg.player_count):
+            faction = self.rng.choice(factions)
+            factions.remove(faction)
+            self.players.append(Player(f"NPC{i}", faction, FACTION_COLOURS[faction], 0, [], [], [], SeenQuads(), set(),
+                                       ai_playstyle=AIPlaystyle(self.rng.choice(list(AttackPlaystyle)),
+                                                                self.rng.choice(list(ExpansionPlaystyle)))))
+
+    def end_turn(self):
+        """
+        Ends the current game turn, processing settlements, blessings, and units.
+        """
+        self.metrics.start_turn(self.turn)
+        for player_idx, player in enumerate(self.players):
+            overall_fortune = 0
+            overall_wealth = 0
+            overall_harvest = 0
+            overall_zeal = 0
+            completed_constructions: typing.List[CompletedConstruction] = []
+            levelled_up_settlements: typing.List[Settlement] = []
+            self.tracer.begin("Settlements", "turn", player=player.name, settlements=len(player.settlements))
+            for setl in player.settlements:
+                # Based on the settlement's satisfaction, place the settlement in a specific state of wealth and
+                # harvest. More specifically, a satisfaction of less than 20 will yield 0 wealth and 0 harvest, a
+                # satisfaction of [20, 40) will yield 0 harvest, a satisfaction of [60, 80) will yield 150% harvest,
+                # and a satisfaction of 80 or more will yield 150% wealth and 150% harvest.
+                if setl.satisfaction < 20:
+                    if player.faction is not Faction.AGRICULTURISTS:
+                        setl.harvest_status = HarvestStatus.POOR
+                    if player.faction is not Faction.CAPITALISTS:
+                        setl.economic_status = EconomicStatus.RECESSION
+                elif setl.satisfaction < 40:
+                    if player.faction is not Faction.AGRICULTURISTS:
+                        setl.harvest_status = HarvestStatus.POOR
+                    setl.economic_status = EconomicStatus.STANDARD
+                elif setl.satisfaction < 60:
+                    setl.harvest_status = HarvestStatus.STANDARD
+                    setl.economic_status = EconomicStatus.STANDARD
+                elif setl.satisfaction < 80:
+                    setl.harvest_status = HarvestStatus.PLENTIFUL
+                    setl.economic_status = EconomicStatus.STANDARD
+                else:
+                    setl.harvest_status = HarvestStatus.PLENTIFUL
+                    setl.economic_status = EconomicStatus.BOOM
+
+                # A settlement is only under siege while the unit besieging it is still alive and deployed. Every
+                # deployed unit is in the spatial index, so a sieging unit missing from it has died or been garrisoned.
+                # This is checked before the settlement's totals are worked out, so that the harvest of a settlement
+                # whose besieger has died is not still reduced, which a loaded game would have no record of either.
+                if setl.under_siege_by is not None and \
+                        (not self.spatial_index.units.contains(setl.under_siege_by) or
+                         setl.under_siege_by.health <= 0):
+                    setl.under_siege_by = None
+
+                total_wealth, total_harvest, total_zeal, total_fortune = \
+                    get_setl_totals(player, setl, self.nighttime_left > 0)
+                overall_fortune += total_fortune
+                overall_wealth += total_wealth
+                overall_harvest += total_harvest
+                overall_zeal += total_zeal
+
+                # If the settlement is under siege, decrease its strength.
+                if setl.under_siege_by is not None:
+                    setl.strength = max(0.0, setl.strength - setl.max_strength * 0.1)
+                else:
+                    # Otherwise, increase the settlement's strength if it was recently under siege and is not at full
+                    # strength.
+                    if setl.strength < setl.max_strength:
+                        setl.strength = min(setl.strength + setl.max_strength * 0.1, setl.max_strength)
+
+                # Reset all units in the garrison in case any were garrisoned this turn.
+                for g in setl.garrison:
+                    g.has_attacked = False
+                    g.remaining_stamina = g.plan.total_stamina
+                    if g.health < g.plan.max_health:
+                        g.health = min(g.health + g.plan.max_health * 0.1, g.plan.max_health)
+
+                # Settlement satisfaction is regulated by the amount of harvest generated against the level.
+                if total_harvest < setl.level * 4:
+                    setl.satisfaction -= (1 if player.faction is Faction.CAPITALISTS else 0.5)
+                elif total_harvest >= setl.level * 8:
+                    setl.satisfaction += 0.25
+                setl.satisfaction = clamp(setl.satisfaction, 0, 100)
+
+                # Process the current construction, completing it if it has been finished.
+                if setl.current_work is not None and not isinstance(setl.current_work.construction, Project):
+                    setl.current_work.zeal_consumed += total_zeal
+                    if setl.current_work.zeal_consumed >= setl.current_work.construction.cost:
+                        completed_constructions.append(CompletedConstruction(setl.current_work.construction, setl))
+                        complete_construction(setl, player)
+
+                setl.harvest_reserves += total_harvest
+                # Settlement levels are increased if the settlement's harvest reserves exceed a certain level (specified
+                # in models.py).
+                level_cap = 5 if player.faction is Faction.RAVENOUS else 10
+                if setl.harvest_reserves >= pow(setl.level, 2) * 25 and setl.level < level_cap:
+                    setl.level += 1
+                    levelled_up_settlements.append(setl)
+            self.tracer.end()
+            # Keep the player's totals across their settlements for the metrics, before unit upkeep is taken away.
+            settlement_yields = overall_wealth, overall_harvest, overall_zeal, overall_fortune
+
+            # Show notifications if the player's constructions have completed or one of their settlements has levelled
+            # up.
+            if player.ai_playstyle is None and len(completed_constructions) > 0:
+                self.notify(NotificationType.CONSTRUCTIONS, completed_constructions)
+            if player.ai_playstyle is None and len(levelled_up_settlements) > 0:
+                self.notify(NotificationType.LEVEL_UP, levelled_up_settlements)
+            # Reset all units.
+            for unit in player.units:
+                unit.remaining_stamina = unit.plan.total_stamina
+                # Heal the unit.
+                if unit.health < unit.plan.max_health:
+                    unit.health = min(unit.health + unit.plan.max_health * 0.1, unit.plan.max_health)
+                unit.has_attacked = False
+                overall_wealth -= unit.plan.cost / 25
+            # Process the current blessing, completing it if it was finished.
+            self.tracer.begin("Blessing", "turn", player=player.name)
+            if player.ongoing_blessing is not None:
+                player.ongoing_blessing.fortune_consumed += overall_fortune
+                if player.ongoing_blessing.fortune_consumed >= player.ongoing_blessing.blessing.cost:
+                    player.blessings.append(player.ongoing_blessing.blessing)
+                    # Show a notification if the player is non-AI.
+                    if player.ai_playstyle is None:
+                        self.notify(NotificationType.BLESSING, player.ongoing_blessing.blessing)
+                    player.ongoing_blessing = None
+            self.tracer.end()
+            # If the player's wealth will go into the negative this turn, sell their units until it's above 0 again, or
+            # until they have none left to sell.
+            while player.wealth + overall_wealth < 0 and player.units:
+                sold_unit = player.units.pop()
+                self.spatial_index.units.remove(sold_unit)
+                self.notify(NotificationType.UNIT_LOST, sold_unit)
+                player.wealth += sold_unit.plan.cost
+            # Update the player's wealth.
+            player.wealth = max(player.wealth + overall_wealth, 0)
+            player.accumulated_wealth += overall_wealth
+            self.metrics.record(player_idx, player, settlement_yields)
+
+        # Spawn a heathen every 5 turns.
+        if self.turn % 5 == 0:
+            with self.tracer.span("Heathen spawn", "heathens"):
+                heathen_loc = self.rng.randint(0, 89), self.rng.randint(0, 99)
+                self.heathens.append(get_heathen(heathen_loc, self.turn))
+                self.spatial_index.heathens.add(self.heathens[-1])
+
+        # Reset all heathens.
+        for heathen in self.heathens:
+            heathen.remaining_stamina = heathen.plan.total_stamina
+            if heathen.health < heathen.plan.max_health:
+                heathen.health = min(heathen.health + heathen.plan.max_health * 0.1, 100)
+
+        self.turn += 1
+
+        # Make night-related calculations, but only if climatic effects are enabled.
+        if self.game_config.climatic_effects:
+            if self.nighttime_left == 0:
+                self.until_night -= 1
+                if self.until_night == 0:
+                    self.notify(NotificationType.NIGHT, True)
+                    # Nights last for between 5 and 25 turns.
+                    self.nighttime_left = self.rng.randint(5, 25)
+                    for h in self.heathens:
+                        h.plan.power = round(2 * h.plan.power)
+                    if self.players[0].faction is Faction.NOCTURNE:
+                        for u in self.players[0].units:
+                            u.plan.power = round(2 * u.plan.power)
+                        for setl in self.players[0].settlements:
+                            for unit in setl.garrison:
+                                unit.plan.power = round(2 * unit.plan.power)
+            else:
+                self.nighttime_left -= 1
+                if self.nighttime_left == 0:
+                    self.until_night = self.rng.randint(10, 20)
+                    self.notify(NotificationType.NIGHT, False)
+                    for h in self.heathens:
+                        h.plan.power = round(h.plan.power / 2)
+                    if self.players[0].faction is Faction.NOCTURNE:
+                        for u in self.players[0].units:
+                            u.plan.power = round(u.plan.power / 4)
+                            u.health = round(u.health / 2)
+                            u.plan.max_health = round(u.plan.max_health / 2)
+                            u.plan.total_stamina = round(u.plan.total_stamina / 2)
+                        for setl in self.players[0].settlements:
+                            for unit in setl.garrison:
+                                unit.plan.power = round(unit.plan.power / 4)
+                                unit.health = round(unit.health / 2)
+                                unit.plan.max_health = round(unit.plan.max_health / 2)
+                                unit.plan.total_stamina = round(unit.plan.total_stamina / 2)
+
+    def check_for_victory(self) -> typing.Optional[Victory]:
+        """
+        Check if any of the six victories have been achieved by any of the players. Also check if any players are close
+        to a victory.
+        :return: A Victory, if one has been achieved.
+        """
+        close_to_vics: typing.List[Victory] = []
+        all_setls = []
+        for pl in self.players:
+            all_setls.extend(pl.settlements)
+
+        players_with_setls = 0
+        for p in self.players:
+            if len(p.settlements) > 0:
+                jubilated_setls = 0
+                lvl_ten_setls = 0
+                constructed_sanctum = False
+
+                # If a player controls all settlements bar one, they are close to an ELIMINATION victory.
+                if len(p.settlements) + 1 == len(all_setls) and VictoryType.ELIMINATION not in p.imminent_victories:
+                    close_to_vics.append(Victory(p, VictoryType.ELIMINATION))
+                    p.imminent_victories.add(VictoryType.ELIMINATION)
+
+                players_with_setls += 1
+                for s in p.settlements:
+                    if s.satisfaction == 100:
+                        jubilated_setls += 1
+                    if s.level == 10:
+                        lvl_ten_setls += 1
+                    if any(imp.name == "Holy Sanctum" for imp in s.improvements):
+                        constructed_sanctum = True
+                    # If a player is currently constructing the Holy Sanctum, they are close to a VIGOUR victory.
+                    elif s.current_work is not None and s.current_work.construction.name == "Holy Sanctum" and \
+                            VictoryType.VIGOUR not in p.imminent_victories:
+                        close_to_vics.append(Victory(p, VictoryType.VIGOUR))
+                        p.imminent_victories.add(VictoryType.VIGOUR)
+                if jubilated_setls >= 5:
+                    p.jubilation_ctr += 1
+                    # If a player has achieved 100% satisfaction in 5 settlements, they are close to (25 turns away)
+                    # from a JUBILATION victory.
+                    if VictoryType.JUBILATION not in p.imminent_victories:
+                        close_to_vics.append(Victory(p, VictoryType.JUBILATION))
+                        p.imminent_victories.add(VictoryType.JUBILATION)
+                else:
+                    p.jubilation_ctr = 0
+                # If the player has maintained 5 settlements at 100% satisfaction for 25 turns, they have achieved a
+                # JUBILATION victory.
+                if p.jubilation_ctr == 25:
+                    return Victory(p, VictoryType.JUBILATION)
+                # If the player has at least 10 settlements of level 10, they have achieved a GLUTTONY victory.
+                if lvl_ten_setls >= 10:
+                    return Victory(p, VictoryType.GLUTTONY)
+                # If a player has 8 level 10 settlements, they are close to a GLUTTONY victory.
+                if lvl_ten_setls >= 8 and VictoryType.GLUTTONY not in p.imminent_victories:
+                    close_to_vics.append(Victory(p, VictoryType.GLUTTONY))
+                    p.imminent_victories.add(VictoryType.GLUTTONY)
+                # If the player has constructed the Holy Sanctum, they have achieved a VIGOUR victory.
+                if constructed_sanctum:
+                    return Victory(p, VictoryType.VIGOUR)
+            elif any(unit.plan.can_settle for unit in self.players[0].units):
+                players_with_setls += 1
+            elif not p.eliminated:
+                p.eliminated = True
+                self.notify(NotificationType.ELIMINATION, p)
+            # If the player has accumulated at least 100k wealth over the game, they have achieved an AFFLUENCE victory.
+            if p.accumulated_wealth >= 100000:
+                return Victory(p, VictoryType.AFFLUENCE)
+            # If a player has accumulated at least 75k wealth over the game, they are close to an AFFLUENCE victory.
+            if p.accumulated_wealth >= 75000 and VictoryType.AFFLUENCE not in p.imminent_victories:
+                close_to_vics.append(Victory(p, VictoryType.AFFLUENCE))
+                p.imminent_victories.add(VictoryType.AFFLUENCE)
+            # If the player has undergone the blessings for all three pieces of ardour, they have achieved a
+            # SERENDIPITY victory.
+            ardour_pieces = len([bls for bls in p.blessings if "Piece of" in bls.name])
+            if ardour_pieces == 3:
+                return Victory(p, VictoryType.SERENDIPITY)
+            # If a player has undergone two of the required three blessings for the pieces of ardour, they are close to
+            # a SERENDIPITY victory.
+            if ardour_pieces == 2 and VictoryType.SERENDIPITY not in p.imminent_victories:
+                close_to_vics.append(Victory(p, VictoryType.SERENDIPITY))
+                p.imminent_victories.add(VictoryType.SERENDIPITY)
+
+        if players_with_setls == 1:
+            # If there is only one player with settlements, they have achieved an ELIMINATION victory.
+            return Victory(next(player for player in self.players if len(player.settlements) > 0),
+                           VictoryType.ELIMINATION)
+
+        # If any players are newly-close to a victory, report that so it can be shown in the overlay.
+        if len(close_to_vics) > 0:
+            self.notify(NotificationType.CLOSE_TO_VIC, close_to_vics)
+
+        return None
+
+    def process_heathens(self):
+        """
+        Process the turns for each of the heathens.
+        """
+        self.tracer.begin("Heathen moves", "heathens", heathens=len(self.heathens))
+        all_units = []
+        for player in self.players:
+            # Heathens will not attack Infidel units.
+            if player.faction is not Faction.INFIDELS:
+                for unit in player.units:
+                    all_units.append(unit)
+        for heathen in self.heathens:
+            within_range: typing.Optional[Unit] = None
+            # Check if any player unit is within range of the heathen.
+            for unit in all_units:
+                if max(abs(unit.location[0] - heathen.location[0]),
+                       abs(unit.location[1] - heathen.location[1])) <= heathen.remaining_stamina and \
+                        heathen.health >= unit.health / 2:
+                    within_range = unit
+                    break
+            # If there is a unit within range, move next to it and attack it.
+            if within_range is not None:
+                if within_range.location[0] - heathen.location[0] < 0:
+                    heathen.location = within_range.location[0] + 1, within_range.location[1]
+                else:
+                    heathen.location = within_range.location[0] - 1, within_range.location[1]
+                heathen.remaining_stamina = 0
+                self.spatial_index.heathens.move(heathen)
+                data = attack(heathen, within_range)
+                if within_range.health <= 0:
+                    # The unit may have already been killed by another heathen this turn.
+                    if (owner := self.spatial_index.units.get_owner(within_range)) is not None:
+                        owner.units.remove(within_range)
+                    self.spatial_index.units.remove(within_range)
+                    self.notify(NotificationType.UNIT_LOST, within_range)
+                if heathen.health <= 0:
+                    self.heathens.remove(heathen)
+                    self.spatial_index.heathens.remove(heathen)
+                # Only report the attack if the unit attacked was the non-AI player's, and survived.
+                if self.spatial_index.units.get_owner(within_range) is self.players[0]:
+                    self.notify(NotificationType.ATTACK, data)
+            else:
+                # If there are no units within range, just move randomly.
+                x_movement = self.rng.randint(-heathen.remaining_stamina, heathen.remaining_stamina)
+                rem_movement = heathen.remaining_stamina - abs(x_movement)
+                y_movement = self.rng.choice([-rem_movement, rem_movement])
+                heathen.location = (clamp(heathen.location[0] + x_movement, 0, 99),
+                                    clamp(heathen.location[1] + y_movement, 0, 89))
+                heathen.remaining_stamina -= abs(x_movement) + abs(y_movement)
+                self.spatial_index.heathens.move(heathen)
+        self.tracer.end()
+
+    def initialise_ais(self):
+        """
+        Initialise the AI players by adding their first settlement in a random location.
+        """
+        for player in self.players:
+            if player.ai_playstyle is not None:
+                setl_coords = self.rng.randint(0, 99), self.rng.randint(0, 89)
+                quad_biome = self.quads[setl_coords[1]][setl_coords[0]].biome
+                setl_name = self.namer.get_settlement_name(quad_biome, self.rng)
+                new_settl = Settlement(setl_name, setl_coords, [],
+                                       [self.quads[setl_coords[1]][setl_coords[0]]],
+                                       [get_default_unit(setl_coords)])
+                if player.faction is Faction.CONCENTRATED:
+                    new_settl.strength *= 2
+                elif player.faction is Faction.FRONTIERSMEN:
+                    new_settl.satisfaction = 75
+                elif player.faction is Faction.IMPERIALS:
+                    new_settl.strength /= 2
+                    new_settl.max_strength /= 2
+                player.settlements.append(new_settl)
+                self.spatial_index.settlements.add(new_settl, player)
+
+    def process_ais(self):
+        """
+        Process the moves for each AI player.
+        """
+        for player in self.players:
+            if player.ai_playstyle is not None:
+                with self.tracer.span("make_move", "ai", player=player.name, units=len(player.units)):
+                    self.move_maker.make_move(player, self.players, self.game_config, self.nighttime_left > 0)
+
+    def play_turn(self, stop_at_victory: bool = True) -> typing.Optional[Victory]:
+        """
+        Play a whole turn with nobody watching, in the same order as in the game: the end of the turn, then heathens,
+        then AIs.
+        :param stop_at_victory: Whether heathens and AIs should not move if the end of the turn brought a victory, as in
+        the game.
+        :return: The victory achieved at the end of the turn, if there was one.
+        """
+        self.end_turn()
+        with self.tracer.span("Victory check", "turn"):
+            victory = self.check_for_victory()
+        if victory is None or not stop_at_victory:
+            self.process_heathens()
+            self.process_ais()
+        # Nobody is watching, so the notifications can be discarded.
+        self.notifications.clear()
+        return victory
+
+    def generate_quads(self):
+        """
+        Generate the quads to be used for this game.
+        """
+        for i in range(90):
+            for j in range(100):
+                if self.game_config.biome_clustering:
+                    # The below block of code gets all directly adjacent quads to the one being currently generated.
+                    surrounding_biomes = []
+                    if i > 0:
+                        if j > 0:
+                            surrounding_biomes.append(self.quads[i - 1][j - 1].biome)
+                        surrounding_biomes.append(self.quads[i - 1][j].biome)
+                        if j < 99:
+                            surrounding_biomes.append(self.quads[i - 1][j + 1].biome)
+                    if j > 0:
+                        surrounding_biomes.append(self.quads[i][j - 1].biome)
+                    if len(surrounding_biomes) > 0:
+                        # Work out which biome nearby is most prevalent, and 40% of the time, choose that biome. This
+                        # 40% rate is adjustable. Note that 100% would result in the entire board having the same biome
+                        # and 0% would result in random picks.
+                        biome_ctr = Counter(surrounding_biomes)
+                        max_rate: Biome = max(biome_ctr, key=biome_ctr.get)
+                        biome: Biome
+                        rand = self.rng.random()
+                        if rand < 0.4:
+                            biome = max_rate
+                        else:
+                            biome = self.rng.choice(list(Biome))
+                    else:
+                        biome = self.rng.choice(list(Biome))
+                else:
+                    # If we're not using biome clustering, just randomly choose one.
+                    biome = self.rng.choice(list(Biome))
+                quad_yield: (float, float, float, float) = calculate_yield_for_quad(biome, self.rng)
+
+                is_relic = False
+                relic_chance = self.rng.randint(0, 100)
+                if relic_chance < 1:
+                    is_relic = True
+
+                self.quads[i][j] = Quad(biome, *quad_yield, is_relic=is_relic)
+
+    def save(self, save_file: typing.TextIO):
+        """
+        Write the state to the given file as JSON.
+        :param save_file: The file to write the save to.
+        """
+        # We use chain.from_iterable() here because the quads array is 2D.
+        save = {
+            "quads": list(chain.from_iterable(self.quads)),
+            "players": self.players,
+            "heathens": self.heathens,
+            "turn": self.turn,
+            "cfg": self.game_config,
+            "night_status": {"until": self.until_night, "remaining": self.nighttime_left},
+            # The generator's state is saved too, so that a loaded game plays out as it would have if it had continued.
+            "rng_state": self.rng.getstate(),
+            # As are the settlement names yet to be given out, which cannot be worked out from the settlements alone, as
+            # settlements can be razed.
+            "settlement_names": {biome.value: names for biome, names in self.namer.names.items()}
+        }
+        # Note that we use the SaveEncoder here for custom encoding for some classes.
+        save_file.write(json.dumps(save, cls=SaveEncoder))
+
+    @staticmethod
+    def load(save_file: typing.TextIO, namer: Namer) -> "GameState":
+        """
+        Read a state previously written by save() from the given file. The spatial index is left empty, so that it can
+        be rebuilt once anything displaying the game is listening to it.
+        :param save_file: The file to read the save from.
+        :param namer: The Namer instance to use for settlement names. It is given the names yet to be given out.
+        :return: The loaded state.
+        """
+        # Use a custom object hook when loading the JSON so that the resulting objects have attribute access.
+        save = json.loads(save_file.read(), object_hook=ObjectConverter)
+        # Load in the quads.
+        quads = [[None] * 100 for _ in range(90)]
+        for i in range(90):
+            for j in range(100):
+                quads[i][j] = save.quads[i * 100 + j]
+                # The biomes require special loading.
+                quads[i][j].biome = Biome[quads[i][j].biome]
+        # Older saves have no seed, so one will be chosen for them.
+        if not hasattr(save.cfg, "seed"):
+            save.cfg.seed = None
+        state = GameState(save.cfg, namer, quads)
+        if hasattr(save, "rng_state"):
+            # JSON has no tuples, so the generator's state must be converted back into them.
+            version, internal_state, gauss_next = save.rng_state
+            state.rng.setstate((version, tuple(internal_state), gauss_next))
+        state.players = save.players
+        # Older saves do not have the settlement names yet to be given out, so the names of the loaded settlements are
+        # removed instead.
+        names_saved = hasattr(save, "settlement_names")
+        if names_saved:
+            for biome in Biome:
+                namer.names[biome] = getattr(save.settlement_names, biome.value)
+        for p in state.players:
+            # Seen quads are saved as packed bits. Older saves stored them as a list of arrays instead, because tuples
+            # do not exist in JSON, so those need to be added one by one.
+            if isinstance(p.quads_seen, str):
+                p.quads_seen = SeenQuads.unpack(p.quads_seen)
+            else:
+                seen_locs = p.quads_seen
+                p.quads_seen = SeenQuads()
+                for loc in seen_locs:
+                    p.quads_seen.add((loc[0], loc[1]))
+            for idx, u in enumerate(p.units):
+                # We can do a direct conversion to Unit objects for units.
+                p.units[idx] = Unit(u.health, u.remaining_stamina, (u.location[0], u.location[1]), u.garrisoned,
+                                    load_unit_plan(u.plan), u.has_attacked, u.sieging, get_loaded_id(u))
+            for s in p.settlements:
+                # Make sure we remove the settlement's name so that we don't get duplicates.
+                if not names_saved:
+                    namer.remove_settlement_name(s.name, s.quads[0].biome)
+                # Another tuple-array fix.
+                s.location = (s.location[0], s.location[1])
+                s.entity_id = get_loaded_id(s)
+                if s.current_work is not None:
+                    # Get the actual Improvement, Project, or UnitPlan objects for the current work. We use
+                    # hasattr() because improvements have an effect where projects do not, and projects have a type
+                    # where unit plans do not.
+                    if hasattr(s.current_work.construction, "effect"):
+                        s.current_work.construction = get_improvement(s.current_work.construction.name)
+                    elif hasattr(s.current_work.construction, "type"):
+                        s.current_work.construction = get_project(s.current_work.construction.name)
+                    else:
+                        s.current_work.construction = load_unit_plan(s.current_work.construction)
+                for idx, imp in enumerate(s.improvements):
+                    # Do another direct conversion for improvements.
+                    s.improvements[idx] = get_improvement(imp.name)
+                # Also convert all units in garrisons to Unit objects.
+                for idx, u in enumerate(s.garrison):
+                    s.garrison[idx] = Unit(u.health, u.remaining_stamina, (u.location[0], u.location[1]),
+                                           u.garrisoned, load_unit_plan(u.plan), u.has_attacked, u.sieging,
+                                           get_loaded_id(u))
+            # We also do direct conversions to Blessing objects for the ongoing one, if there is one, as well as any
+            # previously-completed ones.
+            if p.ongoing_blessing:
+                p.ongoing_blessing.blessing = load_blessing(p.ongoing_blessing.blessing)
+            for idx, bls in enumerate(p.blessings):
+                p.blessings[idx] = load_blessing(bls)
+            if p.ai_playstyle is not None:
+                p.ai_playstyle = AIPlaystyle(AttackPlaystyle[p.ai_playstyle.attacking],
+                                             ExpansionPlaystyle[p.ai_playstyle.expansion])
+            p.imminent_victories = set(p.imminent_victories)
+            p.faction = Faction(p.faction)
+        # Now that every player's units have been loaded, link each settlement under siege to the unit besieging it.
+        # This is necessary so that the siege is not improperly ended because the game thinks the sieging unit has died.
+        # Settlements refer to the unit by its ID, but older saves hold a copy of the unit instead, so the sieging unit
+        # at the copy's location is taken to be it.
+        units_by_id = {u.entity_id: u for p in state.players for u in p.units}
+        sieging_by_location = {u.location: u for p in state.players for u in p.units if u.sieging}
+        for p in state.players:
+            for s in p.settlements:
+                if isinstance(s.under_siege_by, int):
+                    s.under_siege_by = units_by_id.get(s.under_siege_by)
+                elif s.under_siege_by is not None:
+                    s.under_siege_by = sieging_by_location.get((s.under_siege_by.location[0],
+                                                                s.under_siege_by.location[1]))
+        state.heathens = []
+        for h in save.heathens:
+            # Do another direct conversion for the heathens.
+            state.heathens.append(Heathen(h.health, h.remaining_stamina, (h.location[0], h.location[1]),
+                                          UnitPlan(h.plan.power, h.plan.max_health, 2, h.plan.name, None, 0),
+                                          h.has_attacked, get_loaded_id(h)))
+
+        state.turn = save.turn
+        state.until_night = save.night_status.until
+        state.nighttime_left = save.night_status.remaining
+        return state
+
+
+def load_blessing(blessing: ObjectConverter) -> Blessing:
+    """
+    Convert the given loaded blessing to a Blessing. The saved cost is kept rather than taking the catalogue's, as some
+    factions pay more for their blessings.
+    :param blessing: The blessing, as loaded from a save.
+    :return: The converted blessing.
+    """
+    return Blessing(blessing.name, blessing.description, blessing.cost)
+
+
+def load_unit_plan(plan: ObjectConverter) -> UnitPlan:
+    """
+    Convert the given loaded unit plan to a UnitPlan. The saved statistics are kept rather than taking the catalogue's,
+    as some factions' units are stronger, healthier, or faster than others.
+    :param plan: The unit plan, as loaded from a save.
+    :return: The converted unit plan.
+    """
+    prereq = None if plan.prereq is None else get_blessing(plan.prereq.name)
+    return UnitPlan(plan.power, plan.max_health, plan.total_stamina, plan.name, prereq, plan.cost, plan.can_settle)
+
+
+def get_loaded_id(entity: ObjectConverter) -> int:
+    """
+    Get the ID of the given loaded unit, heathen, or settlement, making sure that it is never handed out again.
+    :param entity: The entity, as loaded from a save.
+    :return: The entity's ID. Older saves have no IDs, so a new one is handed out instead.
+    """
+    if not hasattr(entity, "entity_id"):
+        return ENTITY_IDS.take()
+    ENTITY_IDS.skip_past(entity.entity_id)
+    return entity.entity_id
+
+
+def simulate(cfg: GameConfig, turns: int, playstyle: typing.Optional[AIPlaystyle] = None,
+             turn_times: typing.Optional[typing.List[float]] = None, stop_at_victory: bool = True) -> \
+        typing.Tuple[GameState, typing.Optional[Victory]]:
+    """
+    Play an AI-only game with no window or audio, as fast as possible, for the given number of turns or until a player
+    achieves a victory.
+    :param cfg: The game config. The faction in the config is played by an AI like everyone else.
+    :param turns: The maximum number of turns to play.
+    :param playstyle: The playstyle of the AI playing the faction in the config. Chosen randomly if not supplied.
+    :param turn_times: A list to append the time taken to play each turn to, in seconds, if they are to be measured.
+    :param stop_at_victory: Whether the game should end at the first victory. If not, every turn is played, e.g. to
+    measure how the game performs as it grows.
+    :return: The state of the game at the end, and the first victory achieved, if there was one.
+    """
+    state = GameState(cfg, Namer())
+    state.gen_players(ai_only=True)
+    if playstyle is not None:
+        state.players[0].ai_playstyle = playstyle
+    state.initialise_ais()
+    victory: typing.Optional[Victory] = None
+    while state.turn <= turns and (victory is None or not stop_at_victory):
+        turn_start = time.perf_counter()
+        turn_victory = state.play_turn(stop_at_victory)
+        if victory is None:
+            victory = turn_victory
+        if turn_times is not None:
+            turn_times.append(time.perf_counter() - turn_start)
+    return state, victory
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    final_state, final_victory = simulate(GameConfig(4, Faction.AGRICULTURISTS, True, True, True), 500)
+    elapsed = time.perf_counter() - start
+    print(f"Played {final_state.turn - 1} turns in {elapsed:.2f}s ({(final_state.turn - 1) / elapsed:.1f} turns/s).")
+    if final_victory is not None:
+        print(f"{final_victory.player.name} ({final_victory.player.faction.value}) won: {final_victory.type.value}")
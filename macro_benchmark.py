@@ -0,0 +1,153 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+import typing
+
+from benchmark import DEFAULT_THRESHOLD
+from game_state import simulate
+from models import GameConfig, Faction
+
+# The resource module is only available on Unix-like systems, and is only needed to report peak memory usage.
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The seed the scenario is played with, so that every run plays out exactly the same game.
+SCENARIO_SEED = 0
+# The number of players in the scenario, the most the game allows.
+SCENARIO_PLAYERS = 14
+# The number of turns played by default, long enough for the slowest cases to show up as players and units build up.
+# Play carries on after a victory, so that every run plays exactly this many turns.
+DEFAULT_TURNS = 500
+# The measurements compared against baselines, all of which are worse when higher.
+COMPARED_MEASUREMENTS = ["total", "p50", "p95", "max", "peak_rss"]
+
+
+def get_peak_rss() -> typing.Optional[int]:
+    """
+    Get the most memory the process has held in RAM at any one time.
+    :return: The peak resident set size in bytes, or None if it cannot be determined on this system.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports the peak in bytes, whereas Linux reports it in kilobytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_scenario(turns: int, seed: int) -> typing.Dict[str, typing.Any]:
+    """
+    Play the scenario: an AI-only game with every game option enabled and the maximum number of players. The game
+    carries on past any victory, so that every turn requested is played.
+    :param turns: The number of turns to play.
+    :param seed: The seed to play the game with.
+    :return: The total time taken, the percentiles of the time taken by each turn, the peak memory used, the number of
+    turns played, and the first victory achieved, if there was one.
+    """
+    turn_times: typing.List[float] = []
+    start = time.perf_counter()
+    _, victory = simulate(GameConfig(SCENARIO_PLAYERS, Faction.AGRICULTURISTS, True, True, True, seed), turns,
+                          turn_times=turn_times, stop_at_victory=False)
+    total = time.perf_counter() - start
+    # Quantiles need at least two turns to interpolate between. They are interpolated within the turn times measured,
+    # so that no percentile is ever beyond the slowest turn.
+    percentiles = statistics.quantiles(turn_times, n=100, method="inclusive") if len(turn_times) > 1 \
+        else turn_times * 99
+    return {
+        "seed": seed,
+        "turns": len(turn_times),
+        "victory": victory.type.value if victory is not None else None,
+        "total": total,
+        "p50": percentiles[49],
+        "p95": percentiles[94],
+        "max": max(turn_times),
+        "peak_rss": get_peak_rss()
+    }
+
+
+def print_results(results: typing.Dict[str, typing.Any]):
+    """
+    Print the results of playing the scenario.
+    :param results: The results.
+    """
+    victory = f" (first victory: {results['victory']})" if results["victory"] is not None else ""
+    print(f"Played {results['turns']} turns with seed {results['seed']}{victory}.")
+    print(f"Total:    {results['total']:>10.2f}s")
+    print(f"p50 turn: {results['p50'] * 1000:>10.1f}ms")
+    print(f"p95 turn: {results['p95'] * 1000:>10.1f}ms")
+    print(f"Max turn: {results['max'] * 1000:>10.1f}ms")
+    if results["peak_rss"] is not None:
+        print(f"Peak RSS: {results['peak_rss'] / 1024 / 1024:>10.1f}MB")
+
+
+def compare(results: typing.Dict[str, typing.Any], baseline: typing.Dict[str, typing.Any], threshold: float) -> int:
+    """
+    Print how each measurement compares to its baseline, flagging any that have regressed.
+    :param results: The results of this run.
+    :param baseline: The results of a previous run.
+    :param threshold: The fraction by which a measurement may be higher than its baseline before it is flagged.
+    :return: The number of regressions found.
+    :raises ValueError: If the baseline played a different number of turns or a different seed, as its measurements are
+    then not comparable.
+    """
+    if results["seed"] != baseline["seed"] or results["turns"] != baseline["turns"]:
+        raise ValueError(f"the baseline played {baseline['turns']} turns with seed {baseline['seed']}, but this run "
+                         f"played {results['turns']} turns with seed {results['seed']}")
+    regressions = 0
+    print(f"{'Measurement':<14}{'Baseline':>14}{'Current':>14}{'Change':>9}")
+    for name in COMPARED_MEASUREMENTS:
+        before = baseline.get(name)
+        after = results[name]
+        # Peak memory cannot be measured on every system.
+        if before is None or after is None:
+            continue
+        change = (after - before) / before if before > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        if name == "peak_rss":
+            print(f"{name:<14}{before / 1024 / 1024:>12.1f}MB{after / 1024 / 1024:>12.1f}MB{change:>+9.1%}{flag}")
+        else:
+            print(f"{name:<14}{before * 1000:>12.1f}ms{after * 1000:>12.1f}ms{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main():
+    """
+    Play the scenario, then save the results as a baseline or compare them against one, as requested.
+    """
+    parser = argparse.ArgumentParser(description="Time a full AI-only game of Microcosm from start to finish.")
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS, help="turns to play")
+    parser.add_argument("--seed", type=int, default=SCENARIO_SEED, help="seed to play the game with")
+    parser.add_argument("--save", metavar="BASELINE", help="save the results as a baseline to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results against this baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fraction higher than the baseline that counts as a regression")
+    args = parser.parse_args()
+    if args.turns < 1:
+        parser.error("at least one turn must be played")
+
+    results = run_scenario(args.turns, args.seed)
+    print_results(results)
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Saved baseline to {args.save}.")
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        try:
+            regressions = compare(results, baseline, args.threshold)
+        except ValueError as error:
+            sys.exit(f"Cannot compare against {args.compare}: {error}.")
+        if regressions > 0:
+            print(f"{regressions} measurement(s) regressed by more than {args.threshold:.0%}.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import typing
+
+import pyxel
+
+from models import Quad, Biome
+from night_vision import NightVision
+from renderer import Renderer
+from resource_manager import ResourceManager
+from seen_quads import SeenQuads
+
+# The colour used to mark the see-through parts of the fog masks. This must not appear in the fog quad itself.
+MASK_COLKEY = pyxel.COLOR_NAVY
+
+
+class MapLayer:
+    """
+    The class responsible for keeping pre-rendered images of the entire board, for both day and night, along with the
+    fog masks that are drawn over them.
+    """
+    def __init__(self, quads: typing.List[typing.List[Quad]], resources: ResourceManager):
+        """
+        Render every quad on the board to the day and night images, and cover the whole board in fog.
+        :param quads: The 2D list of quads making up the board.
+        :param resources: The ResourceManager holding the loaded quad images.
+        """
+        self.quads = quads
+        self.resources: ResourceManager = resources
+        height = len(quads)
+        width = len(quads[0])
+        self.day = pyxel.Image(width * 8, height * 8)
+        self.night = pyxel.Image(width * 8, height * 8)
+        # The fog mask displays the fog quad over the quads the player has not yet seen, and the night mask blacks out
+        # all quads beyond the player's limited nighttime vision.
+        self.fog = pyxel.Image(width * 8, height * 8)
+        self.night_fog = pyxel.Image(width * 8, height * 8)
+        # The quads that have been cut out of the fog mask.
+        self.revealed = SeenQuads()
+        for i in range(height):
+            for j in range(width):
+                self.redraw_quad(j, i)
+                self.fog.blt(j * 8, i * 8, self.resources.quads, 0, 12, 8, 8)
+
+    def redraw_quad(self, x: int, y: int):
+        """
+        Re-render the quad at the given location to the day and night images, e.g. when a relic has been investigated.
+        :param x: The X coordinate of the quad.
+        :param y: The Y coordinate of the quad.
+        """
+        quad = self.quads[y][x]
+        quad_x: int = 0
+        if quad.biome is Biome.FOREST:
+            quad_x = 8
+        elif quad.biome is Biome.SEA:
+            quad_x = 16
+        elif quad.biome is Biome.MOUNTAIN:
+            quad_x = 24
+        quad_y = 20 if quad.is_relic else 4
+        self.day.blt(x * 8, y * 8, self.resources.quads, quad_x, quad_y, 8, 8)
+        self.night.blt(x * 8, y * 8, self.resources.quads, quad_x + 32, quad_y, 8, 8)
+
+    def draw(self, renderer: Renderer, map_pos: (int, int), is_night: bool):
+        """
+        Draw the section of the board currently in view with a single blit.
+        :param renderer: The renderer to draw to.
+        :param map_pos: The current map position.
+        :param is_night: Whether it is currently night.
+        """
+        renderer.blt(4, 4, self.night if is_night else self.day, map_pos[0] * 8, map_pos[1] * 8, 192, 176)
+
+    def draw_fog(self, renderer: Renderer, map_pos: (int, int), quads_seen: SeenQuads, blacked_out: bool):
+        """
+        Draw the fog over the quads in view that the player has not yet seen, revealing any newly-seen quads first.
+        :param renderer: The renderer to draw to.
+        :param map_pos: The current map position.
+        :param quads_seen: The quads the player has seen.
+        :param blacked_out: Whether the unseen quads should be drawn in black rather than with the fog quad, as is the
+        case at night.
+        """
+        # Seen quads are only ever added, so there is only work to do when the number of them has changed.
+        if len(quads_seen) != len(self.revealed):
+            for loc in quads_seen.difference(self.revealed):
+                self.fog.rect(loc[0] * 8, loc[1] * 8, 8, 8, MASK_COLKEY)
+            self.revealed.update(quads_seen)
+        if blacked_out:
+            renderer.pal(pyxel.COLOR_WHITE, pyxel.COLOR_BLACK)
+            renderer.pal(pyxel.COLOR_GRAY, pyxel.COLOR_BLACK)
+        renderer.blt(4, 4, self.fog, map_pos[0] * 8, map_pos[1] * 8, 192, 176, MASK_COLKEY)
+        if blacked_out:
+            renderer.pal()
+
+    def draw_night_fog(self, renderer: Renderer, map_pos: (int, int), night_vision: NightVision):
+        """
+        Black out the quads in view that are beyond the player's nighttime vision, updating the night mask first for
+        any quads whose visibility has changed.
+        :param renderer: The renderer to draw to.
+        :param map_pos: The current map position.
+        :param night_vision: The player's nighttime vision.
+        """
+        for loc in night_vision.take_changes():
+            colour = MASK_COLKEY if loc in night_vision.visible else pyxel.COLOR_BLACK
+            self.night_fog.rect(loc[0] * 8, loc[1] * 8, 8, 8, colour)
+        renderer.blt(4, 4, self.night_fog, map_pos[0] * 8, map_pos[1] * 8, 192, 176, MASK_COLKEY)
@@ -0,0 +1,158 @@
+import argparse
+import dataclasses
+import sys
+import tracemalloc
+import typing
+from enum import Enum
+
+from catalogue import Namer, BLESSINGS, IMPROVEMENTS, PROJECTS, UNIT_PLANS
+from game_state import GameState
+from models import GameConfig, Faction
+
+# The number of turns played by default, long enough for heathens and fog to have built up.
+DEFAULT_TURNS = 1000
+# The number of turns between each measurement.
+DEFAULT_INTERVAL = 100
+# The number of source files listed as allocating the most memory at the end of the report.
+TOP_ALLOCATIONS = 5
+# The categories of game state measured, in the order they are measured. Objects shared between categories, such as
+# the quads of settlements, are only counted in the first category they are found in. The indexes and distance fields
+# used for pathing refer to the entities and players they index, so they are measured last to only count themselves.
+CATEGORIES = ["quads", "fog", "plans", "units", "heathens", "settlements", "players", "pathing"]
+# Before Python 3.11, every object has a dictionary of its own holding its attributes. From 3.11, the dictionary is only
+# created when asked for, so measuring must not ask for it.
+EAGER_INSTANCE_DICTS = sys.version_info < (3, 11)
+
+
+def get_deep_size(obj: typing.Any, seen: typing.Set[int]) -> int:
+    """
+    Get the size in bytes of the given object and everything it refers to, skipping anything already seen. Objects are
+    recognised by their IDs, so everything measured must be kept alive until measuring is done.
+    :param obj: The object to measure.
+    :param seen: The IDs of the objects already measured. Updated with every object measured here.
+    :return: The total size of every object measured.
+    """
+    size = 0
+    to_measure = [obj]
+    while to_measure:
+        current = to_measure.pop()
+        # Singletons, enum members, and classes belong to the program rather than to any game.
+        if current is None or isinstance(current, (bool, Enum, type)) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            to_measure.extend(current.keys())
+            to_measure.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            to_measure.extend(current)
+        elif dataclasses.is_dataclass(current):
+            if EAGER_INSTANCE_DICTS:
+                size += sys.getsizeof(vars(current))
+            to_measure.extend(getattr(current, field.name) for field in dataclasses.fields(current))
+        elif hasattr(current, "__dict__"):
+            to_measure.append(vars(current))
+    return size
+
+
+def get_static_ids() -> typing.Set[int]:
+    """
+    Get the IDs of the catalogue's objects, which games refer to but do not own, so that they are not measured.
+    :return: The IDs of every object in the catalogue.
+    """
+    static_ids: typing.Set[int] = set()
+    for static in (BLESSINGS, IMPROVEMENTS, PROJECTS, UNIT_PLANS):
+        get_deep_size(static, static_ids)
+    return static_ids
+
+
+def measure_state(state: GameState) -> typing.Dict[str, int]:
+    """
+    Measure the size in bytes of each category of the given game state.
+    :param state: The state to measure.
+    :return: The size of each category.
+    """
+    seen = get_static_ids()
+    all_units = [unit for player in state.players for unit in player.units] + \
+        [unit for player in state.players for setl in player.settlements for unit in setl.garrison]
+    return {
+        "quads": get_deep_size(state.quads, seen),
+        "fog": sum(get_deep_size(player.quads_seen, seen) for player in state.players),
+        # Every unit and heathen has its own copy of its plan.
+        "plans": sum(get_deep_size(unit.plan, seen) for unit in all_units + state.heathens),
+        "units": sum(get_deep_size(unit, seen) for unit in all_units),
+        "heathens": get_deep_size(state.heathens, seen),
+        "settlements": sum(get_deep_size(player.settlements, seen) for player in state.players),
+        # Whatever else the players hold, such as their blessings and imminent victories.
+        "players": get_deep_size(state.players, seen),
+        # The AI players' distance fields, the relic field shared between them, and the spatial and relic indexes.
+        "pathing": sum(get_deep_size(pathing, seen) for pathing in
+                       (state.move_maker.settling_fields, state.move_maker.enemy_setl_fields,
+                        state.move_maker.combined_fields, state.move_maker.roaming_field, state.relic_field,
+                        state.spatial_index, state.relics))
+    }
+
+
+def print_report(samples: typing.List[typing.Tuple[int, typing.Dict[str, int], int]]):
+    """
+    Print the size of each category at each measurement, along with how much each grew per turn on average.
+    :param samples: The turn, category sizes, and memory traced by tracemalloc for each measurement.
+    """
+    print(f"{'Turn':>6}" + "".join(f"{category:>13}" for category in CATEGORIES) + f"{'Traced':>13}")
+    for turn, sizes, traced in samples:
+        print(f"{turn:>6}" + "".join(f"{sizes[category] / 1024:>11.1f}KB" for category in CATEGORIES) +
+              f"{traced / 1024:>11.1f}KB")
+    if len(samples) > 1:
+        first_turn, first_sizes, first_traced = samples[0]
+        last_turn, last_sizes, last_traced = samples[-1]
+        turns = max(last_turn - first_turn, 1)
+        print(f"{'/turn':>6}" +
+              "".join(f"{(last_sizes[category] - first_sizes[category]) / turns:>+11.0f} B"
+                      for category in CATEGORIES) +
+              f"{(last_traced - first_traced) / turns:>+11.0f} B")
+
+
+def main():
+    """
+    Play an AI-only game, or continue a saved one, measuring the memory used by each category of its state as it goes.
+    """
+    parser = argparse.ArgumentParser(description="Report what the memory used by a game of Microcosm is made up of.")
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS, help="turns to play")
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL, help="turns between measurements")
+    parser.add_argument("--players", type=int, default=8, help="players in a new game")
+    parser.add_argument("--seed", type=int, default=None, help="seed for a new game")
+    parser.add_argument("--save", help="continue the game in this save file instead of starting a new one")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    if args.save is not None:
+        with open(args.save, "r", encoding="utf-8") as save_file:
+            state = GameState.load(save_file, Namer())
+        state.spatial_index.rebuild(state.players, state.heathens)
+        # The player's faction is played by an AI from here on too.
+        state.players[0].ai_playstyle = state.players[1].ai_playstyle
+    else:
+        state = GameState(GameConfig(args.players, Faction.AGRICULTURISTS, True, True, True, args.seed), Namer())
+        state.gen_players(ai_only=True)
+        state.initialise_ais()
+
+    start_turn = state.turn
+    samples = [(state.turn, measure_state(state), tracemalloc.get_traced_memory()[0])]
+    victory = None
+    while state.turn < start_turn + args.turns and victory is None:
+        victory = state.play_turn()
+        if (state.turn - start_turn) % args.interval == 0:
+            samples.append((state.turn, measure_state(state), tracemalloc.get_traced_memory()[0]))
+    # Always finish with a measurement of the final state, e.g. if a victory ended the game early.
+    if samples[-1][0] != state.turn:
+        samples.append((state.turn, measure_state(state), tracemalloc.get_traced_memory()[0]))
+
+    print_report(samples)
+    print(f"Peak traced memory: {tracemalloc.get_traced_memory()[1] / 1024:.1f}KB")
+    print("Largest allocations by file:")
+    for stat in tracemalloc.take_snapshot().statistics("filename")[:TOP_ALLOCATIONS]:
+        print(f"  {stat}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import csv
+import typing
+from array import array
+
+from models import Player
+
+# numpy is optional, and only needed to export metrics as NPZ.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Whether metrics can be exported as NPZ, so that callers can check before playing any games.
+NPZ_AVAILABLE = numpy is not None
+
+# The statistics recorded for each player every turn, along with the typecode of the array each is kept in. The yields
+# are the player's totals across their settlements, as returned by get_player_totals().
+METRICS: typing.Dict[str, str] = {
+    "wealth": "d",
+    "wealth_yield": "d",
+    "harvest_yield": "d",
+    "zeal_yield": "d",
+    "fortune_yield": "d",
+    "settlements": "l",
+    "units": "l",
+    "accumulated_wealth": "d",
+    "blessings": "l"
+}
+
+
+class TurnMetrics:
+    """
+    The class responsible for keeping a time series of statistics for each player, appended to at the end of every
+    turn. Each statistic for each player is kept in its own typed array, so that recording costs next to nothing and
+    long games take up little memory.
+    """
+    def __init__(self):
+        """
+        Initialise the metrics with nothing recorded.
+        """
+        # The turn each recording was made at the end of.
+        self.turns: array = array("l")
+        # The recorded values of each metric, by metric name, with one array for each player.
+        self.series: typing.Dict[str, typing.List[array]] = {name: [] for name in METRICS}
+
+    def start_turn(self, turn: int):
+        """
+        Begin recording the end of the given turn.
+        :param turn: The turn being ended.
+        """
+        self.turns.append(turn)
+
+    def record(self, player_idx: int, player: Player, yields: typing.Tuple[float, float, float, float]):
+        """
+        Record the statistics for the given player at the end of the current turn.
+        :param player_idx: The index of the player in the game's list of players.
+        :param player: The player to record statistics for.
+        :param yields: The player's wealth, harvest, zeal, and fortune totals across their settlements, which the end of
+        the turn has already calculated.
+        """
+        # Players are only ever added at the start of a game, so any new player will be recorded from the first turn.
+        if player_idx == len(self.series["wealth"]):
+            for name, typecode in METRICS.items():
+                self.series[name].append(array(typecode))
+        series = self.series
+        series["wealth"][player_idx].append(player.wealth)
+        series["wealth_yield"][player_idx].append(yields[0])
+        series["harvest_yield"][player_idx].append(yields[1])
+        series["zeal_yield"][player_idx].append(yields[2])
+        series["fortune_yield"][player_idx].append(yields[3])
+        series["settlements"][player_idx].append(len(player.settlements))
+        series["units"][player_idx].append(len(player.units))
+        series["accumulated_wealth"][player_idx].append(player.accumulated_wealth)
+        series["blessings"][player_idx].append(len(player.blessings))
+
+    def export_csv(self, metrics_file: typing.TextIO, players: typing.List[Player]):
+        """
+        Write the recorded metrics to the given file as CSV, with a row for each player at the end of each turn.
+        :param metrics_file: The file to write the metrics to.
+        :param players: The players the metrics were recorded for.
+        """
+        writer = csv.writer(metrics_file)
+        writer.writerow(["turn", "player", "faction"] + list(METRICS))
+        for turn_idx, turn in enumerate(self.turns):
+            for player_idx, player in enumerate(players):
+                writer.writerow([turn, player.name, player.faction.value] +
+                                [self.series[name][player_idx][turn_idx] for name in METRICS])
+
+    def export_npz(self, path: str, players: typing.List[Player]):
+        """
+        Write the recorded metrics to the given path as a compressed NPZ archive, with an array of turns, an array of
+        player names, and an array of each metric with a row for each player. Requires numpy.
+        :param path: The path to write the archive to.
+        :param players: The players the metrics were recorded for.
+        """
+        if not NPZ_AVAILABLE:
+            raise RuntimeError("Exporting metrics as NPZ requires numpy to be installed.")
+        numpy.savez_compressed(path, turns=numpy.array(self.turns), players=numpy.array([p.name for p in players]),
+                               **{name: numpy.array(self.series[name]) for name in METRICS})
@@ -1,7 +1,9 @@
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+from seen_quads import SeenQuads
+
 
 class Biome(str, Enum):
     """
@@ -150,6 +152,23 @@ class OverlayType(Enum):
     CLOSE_TO_VIC = "CLOSE_TO_VIC"
     INVESTIGATION = "INVESTIGATION"
     NIGHT = "NIGHT"
+    PERFORMANCE = "PERFORMANCE"
+
+
+class NotificationType(Enum):
+    """
+    The events that occur while processing turns that the non-AI player may need to be shown.
+    """
+    CONSTRUCTIONS = "CONSTRUCTIONS"
+    LEVEL_UP = "LEVEL_UP"
+    BLESSING = "BLESSING"
+    UNIT_LOST = "UNIT_LOST"
+    NIGHT = "NIGHT"
+    ELIMINATION = "ELIMINATION"
+    CLOSE_TO_VIC = "CLOSE_TO_VIC"
+    ATTACK = "ATTACK"
+    SETL_ATTACK = "SETL_ATTACK"
+    SIEGE = "SIEGE"
 
 
 class SettlementAttackType(Enum):
@@ -179,6 +198,38 @@ class ConstructionMenu(Enum):
     UNITS = "UNITS"
 
 
+class EntityIds:
+    """
+    The class responsible for handing out the IDs that units, heathens, and settlements are told apart by. IDs are kept
+    when a game is saved, so a loaded game's IDs must be skipped past before any more are handed out.
+    """
+    def __init__(self):
+        """
+        Initialise the IDs, starting from 1.
+        """
+        self.next_id: int = 1
+
+    def take(self) -> int:
+        """
+        Hand out a new ID.
+        :return: An ID that has not been handed out before.
+        """
+        entity_id = self.next_id
+        self.next_id += 1
+        return entity_id
+
+    def skip_past(self, entity_id: int):
+        """
+        Make sure that the given ID, e.g. of a loaded unit, is never handed out.
+        :param entity_id: The ID already in use.
+        """
+        self.next_id = max(self.next_id, entity_id + 1)
+
+
+# The IDs for every unit, heathen, and settlement created.
+ENTITY_IDS = EntityIds()
+
+
 @dataclass
 class Quad:
     """
@@ -253,7 +304,9 @@ class UnitPlan:
     can_settle: bool = False
 
 
-@dataclass
+# Units, heathens, and settlements are compared by identity rather than by their fields, so that two units that happen
+# to look the same are never mistaken for one another.
+@dataclass(eq=False)
 class Unit:
     """
     The actual instance of a unit, based on a UnitPlan.
@@ -265,9 +318,10 @@ class Unit:
     plan: UnitPlan
     has_attacked: bool = False  # Units can only attack once per turn.
     sieging: bool = False
+    entity_id: int = field(default_factory=ENTITY_IDS.take)
 
 
-@dataclass
+@dataclass(eq=False)
 class Heathen:
     """
     A roaming unit that doesn't belong to any player that will attack any unit it sees.
@@ -277,6 +331,7 @@ class Heathen:
     location: (float, float)
     plan: UnitPlan
     has_attacked: bool = False  # Heathens can also only attack once per turn.
+    entity_id: int = field(default_factory=ENTITY_IDS.take)
 
 
 @dataclass
@@ -297,7 +352,7 @@ class OngoingBlessing:
     fortune_consumed: float = 0.0
 
 
-@dataclass
+@dataclass(eq=False)
 class Settlement:
     """
     A settlement belonging to a player.
@@ -330,6 +385,7 @@ class Settlement:
     economic_status: EconomicStatus = EconomicStatus.STANDARD
     produced_settler: bool = False  # Used for AI players so that settlements don't get stuck producing settlers.
     under_siege_by: typing.Optional[Unit] = None
+    entity_id: int = field(default_factory=ENTITY_IDS.take)
 
 
 @dataclass
@@ -362,7 +418,7 @@ class Player:
     settlements: typing.List[Settlement]
     units: typing.List[Unit]
     blessings: typing.List[Blessing]
-    quads_seen: typing.Set[typing.Tuple[int, int]]
+    quads_seen: SeenQuads
     imminent_victories: typing.Set[VictoryType]
     ongoing_blessing: typing.Optional[OngoingBlessing] = None
     ai_playstyle: typing.Optional[AIPlaystyle] = None
@@ -410,6 +466,8 @@ class GameConfig:
     biome_clustering: bool
     fog_of_war: bool
     climatic_effects: bool
+    # The seed for the game's random number generator. One is chosen when the game starts if not supplied.
+    seed: typing.Optional[int] = None
 
 
 @dataclass
@@ -419,3 +477,12 @@ class Victory:
     """
     player: Player
     type: VictoryType
+
+
+@dataclass
+class Notification:
+    """
+    An event that occurred while processing a turn, along with the data required to display it.
+    """
+    type: NotificationType
+    args: typing.Tuple[typing.Any, ...]
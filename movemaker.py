@@ -1,4 +1,3 @@
-import random
 import typing
 
 from calculator import get_player_totals, get_setl_totals, attack, complete_construction, clamp, attack_setl, \
@@ -6,7 +5,11 @@ from calculator import get_player_totals, get_setl_totals, attack, complete_cons
 from catalogue import get_available_blessings, get_unlockable_improvements, get_unlockable_units, \
     get_available_improvements, get_available_unit_plans, Namer
 from models import Player, Blessing, AttackPlaystyle, OngoingBlessing, Settlement, Improvement, UnitPlan, \
-    Construction, Unit, ExpansionPlaystyle, Quad, GameConfig, Faction
+    Construction, Unit, ExpansionPlaystyle, GameConfig, Faction, NotificationType
+from pathing import DistanceField, BOARD_WIDTH, BOARD_HEIGHT
+
+# The closest, in moves, that an AI player's settlers will found a settlement to the player's other settlements.
+SETTLEMENT_SPACING = 10
 
 
 def set_blessing(player: Player, player_totals: (float, float, float, float)):
@@ -229,21 +232,30 @@ class MoveMaker:
         :param namer: The Namer instance to use for settlement names.
         """
         self.namer: Namer = namer
-        self.board_ref = None
+        self.state_ref = None
+        # The distance field guiding the units of the player currently moving towards their goals when there is nothing
+        # in range for them to attack or investigate. Only looked up if one of the player's units needs it.
+        self.roaming_field: typing.Optional[DistanceField] = None
+        # The distance field guiding each AI player's settlers, by player name, along with the settlement locations it
+        # was calculated for. Settlements are mostly founded rather than lost, so the fields can usually be kept from
+        # one turn to the next, only keeping away from the new settlements.
+        self.settling_fields: typing.Dict[str, typing.Tuple[typing.Set[typing.Tuple[int, int]], DistanceField]] = {}
+        # The distance field to the settlements of each aggressive AI player's enemies, by player name, along with the
+        # settlement locations it was calculated for, kept from one turn to the next in the same way.
+        self.enemy_setl_fields: typing.Dict[str, typing.Tuple[typing.Set[typing.Tuple[int, int]], DistanceField]] = {}
+        # The distance field to both the enemy settlements and the relics for each aggressive AI player, by player name,
+        # along with the relic field it was combined from. The fields are kept until a relic is investigated.
+        self.combined_fields: typing.Dict[str, typing.Tuple[DistanceField, DistanceField]] = {}
 
-    def make_move(self, player: Player, all_players: typing.List[Player], quads: typing.List[typing.List[Quad]],
-                  cfg: GameConfig, is_night: bool):
+    def make_move(self, player: Player, all_players: typing.List[Player], cfg: GameConfig, is_night: bool):
         """
         Make a move for the given AI player.
         :param player: The AI player to make a move for.
         :param all_players: The list of all players.
-        :param quads: The 2D list of quads to use to search for relics.
         :param cfg: The game configuration.
         :param is_night: Whether it is night.
         """
-        all_setls = []
-        for pl in all_players:
-            all_setls.extend(pl.settlements)
+        self.roaming_field = None
         player_totals = get_player_totals(player, is_night)
         if player.ongoing_blessing is None:
             set_blessing(player, player_totals)
@@ -269,6 +281,7 @@ class MoveMaker:
                         unit.garrisoned = False
                         unit.location = setl.location[0], setl.location[1] + 1
                         player.units.append(unit)
+                        self.state_ref.spatial_index.units.add(unit, player)
                         setl.garrison.remove(unit)
             # Deploy a unit from the garrison if the AI is not defensive, or the settlement is under siege or attack, or
             # there are too many units garrisoned.
@@ -279,88 +292,95 @@ class MoveMaker:
                 deployed.garrisoned = False
                 deployed.location = setl.location[0], setl.location[1] + 1
                 player.units.append(deployed)
-        all_units = []
-        for p in all_players:
-            if p is not player:
-                for unit in p.units:
-                    all_units.append(unit)
+                self.state_ref.spatial_index.units.add(deployed, player)
+        # Whether any of the player's settlements are under siege or attack only needs to be worked out once for all of
+        # their units.
+        under_threat = any(setl.under_siege_by is not None or setl.strength < setl.max_strength / 2
+                           for setl in player.settlements)
         min_pow_health: (float, Unit) = 9999, None  # 9999 is arbitrary, but no unit will ever have this.
         # Move each deployed unit, and also work out which of the player's units has the lowest combined power and
         # health. This is subsequently used if we need to sell units due to negative wealth.
         for unit in player.units:
-            if pow_health := (unit.health + unit.plan.power) < min_pow_health[0]:
+            if (pow_health := unit.health + unit.plan.power) < min_pow_health[0]:
                 min_pow_health = pow_health, unit
-            self.move_unit(player, unit, all_units, all_players, all_setls, quads, cfg)
-        if player.wealth + player_totals[0] < 0:
+            with self.state_ref.tracer.span("move_unit", "ai", unit=unit.plan.name):
+                self.move_unit(player, unit, all_players, under_threat, cfg)
+        # A player without any deployed units has nothing to sell.
+        if player.wealth + player_totals[0] < 0 and min_pow_health[1] is not None:
             player.wealth += min_pow_health[1].plan.cost
             player.units.remove(min_pow_health[1])
+            self.state_ref.spatial_index.units.remove(min_pow_health[1])
 
-    def move_unit(self, player: Player, unit: Unit, other_units: typing.List[Unit], all_players: typing.List[Player],
-                  all_setls: typing.List[Settlement], quads: typing.List[typing.List[Quad]], cfg: GameConfig):
+    def move_unit(self, player: Player, unit: Unit, all_players: typing.List[Player], under_threat: bool,
+                  cfg: GameConfig):
         """
         Move the given unit, attacking if the right conditions are met.
         :param player: The AI owner of the unit being moved.
         :param unit: The unit being moved.
-        :param other_units: The list of all enemy units.
         :param all_players: The list of all players.
-        :param all_setls: The list of all settlements.
-        :param quads: The 2D list of quads to use to search for relics.
+        :param under_threat: Whether any of the player's settlements are under siege or attack.
         :param cfg: The game configuration.
         """
-        # If the unit can settle, randomly move it until it is far enough away from any of the player's other
-        # settlements. Once this has been achieved, found a new settlement and destroy the unit.
+        # If the unit can settle, move it until it is far enough away from any of the player's other settlements. Once
+        # this has been achieved, found a new settlement and destroy the unit.
         if unit.plan.can_settle:
-            x_movement = random.randint(-unit.remaining_stamina, unit.remaining_stamina)
-            rem_movement = unit.remaining_stamina - abs(x_movement)
-            y_movement = random.choice([-rem_movement, rem_movement])
-            unit.location = clamp(unit.location[0] + x_movement, 0, 99), clamp(unit.location[1] + y_movement, 0, 89)
-            unit.remaining_stamina -= abs(x_movement) + abs(y_movement)
+            self.move_towards_goal(unit, self.get_settling_field(player))
 
             far_enough = True
             for setl in player.settlements:
                 dist = max(abs(unit.location[0] - setl.location[0]), abs(unit.location[1] - setl.location[1]))
-                if dist < 10:
+                if dist < SETTLEMENT_SPACING:
                     far_enough = False
-            if far_enough:
-                quad_biome = self.board_ref.quads[unit.location[1]][unit.location[0]].biome
-                setl_name = self.namer.get_settlement_name(quad_biome)
+            # The settler never moves onto another unit or a settlement, but it can be left sharing a quad with one if
+            # it was unable to move away, in which case it must wait for the quad to be cleared.
+            spatial_index = self.state_ref.spatial_index
+            occupied = spatial_index.settlements.is_occupied(unit.location) or \
+                len(spatial_index.units.get_at(unit.location)) > 1
+            if far_enough and not occupied:
+                quad_biome = self.state_ref.quads[unit.location[1]][unit.location[0]].biome
+                setl_name = self.namer.get_settlement_name(quad_biome, self.state_ref.rng)
                 new_settl = Settlement(setl_name, unit.location, [],
-                                       [self.board_ref.quads[unit.location[1]][unit.location[0]]], [])
+                                       [self.state_ref.quads[unit.location[1]][unit.location[0]]], [])
                 if player.faction is Faction.FRONTIERSMEN:
                     new_settl.satisfaction = 75
                 elif player.faction is Faction.IMPERIALS:
                     new_settl.strength /= 2
                     new_settl.max_strength /= 2
                 player.settlements.append(new_settl)
+                spatial_index.settlements.add(new_settl, player)
                 player.units.remove(unit)
+                spatial_index.units.remove(unit)
         else:
             attack_over_siege = True  # If False, the unit will siege the settlement.
             within_range: typing.Optional[typing.Union[Unit, Settlement]] = None
+            # The owner of the entity within range.
+            target_owner: typing.Optional[Player] = None
+            # Only enemy units and settlements close enough to be attacked are considered, so they are looked up from
+            # the spatial index. The index finds them in whatever order they were placed in it, which is not kept when a
+            # game is saved, so the oldest of them by ID is chosen, in order for a loaded game to play out as it would
+            # have.
+            reach = unit.remaining_stamina
+            min_x, max_x = unit.location[0] - reach, unit.location[0] + reach
+            min_y, max_y = unit.location[1] - reach, unit.location[1] + reach
             # If the unit cannot settle, then we must first check if it meets the criteria to attack another unit. A
             # unit can attack if any of its settlements are under siege or attack, or if the AI is aggressive, or if the
             # AI is neutral but with a health advantage over another unit, or lastly, if the other unit is an Infidel.
-            for other_u in other_units:
-                is_infidel = False
-                for pl in all_players:
-                    if pl.faction is Faction.INFIDELS and other_u in pl.units:
-                        is_infidel = True
-                        break
-                could_attack: bool = any(setl.under_siege_by is not None or setl.strength < setl.max_strength / 2
-                                         for setl in player.settlements) or \
-                    player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE or \
-                    (player.ai_playstyle.attacking is AttackPlaystyle.NEUTRAL and
-                     unit.health >= other_u.health * 2) or is_infidel
-                # Of course, the attacked unit has to be close enough.
-                if max(abs(unit.location[0] - other_u.location[0]),
-                       abs(unit.location[1] - other_u.location[1])) <= unit.remaining_stamina and could_attack and \
-                        other_u is not unit:
-                    within_range = other_u
-                    break
-            if within_range is None:
+            units_in_reach = self.state_ref.spatial_index.units.query(min_x, min_y, max_x, max_y)
+            attackable_units = [(other_u, owner) for other_u, owner in units_in_reach
+                                if owner is not player and
+                                (under_threat or player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE or
+                                 (player.ai_playstyle.attacking is AttackPlaystyle.NEUTRAL and
+                                  unit.health >= other_u.health * 2) or owner.faction is Faction.INFIDELS)]
+            if attackable_units:
+                within_range, target_owner = min(attackable_units, key=lambda pair: pair[0].entity_id)
+            else:
                 # If there are no other units within range and attackable, then we check if there are any enemy
                 # settlements we can attack or place under siege.
-                for other_setl in all_setls:
-                    if other_setl not in player.settlements:
+                setls_in_reach = self.state_ref.spatial_index.settlements.query(min_x, min_y, max_x, max_y)
+                # Each settlement that can be targeted, along with whether it can be attacked rather than sieged.
+                targetable_setls: typing.List[typing.Tuple[Settlement, Player, bool]] = []
+                for other_setl, owner in setls_in_reach:
+                    if owner is not player:
                         # Settlements are only attacked by AI players under strict conditions. Even aggressive AIs need
                         # to double the strength of the settlement in their health.
                         could_attack: bool = (player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE and
@@ -369,24 +389,17 @@ class MoveMaker:
                                               unit.health >= other_setl.strength * 10) or \
                                              (player.ai_playstyle.attacking is AttackPlaystyle.DEFENSIVE and
                                               other_setl.strength == 0)
-                        if could_attack:
-                            if max(abs(unit.location[0] - other_setl.location[0]),
-                                   abs(unit.location[1] - other_setl.location[1])) <= unit.remaining_stamina:
-                                within_range = other_setl
-                                break
-                        else:
-                            # If there are no attackable settlements, we check if the AI player can place any under
-                            # siege. Aggressive AIs will place any settlement they can see under siege, and neutral AIs
-                            # will do the same if they have the upper hand.
-                            could_siege: bool = player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE or \
-                                                (player.ai_playstyle.attacking is AttackPlaystyle.NEUTRAL and
-                                                 unit.health >= other_setl.strength * 2)
-                            if could_siege:
-                                if max(abs(unit.location[0] - other_setl.location[0]),
-                                       abs(unit.location[1] - other_setl.location[1])) <= unit.remaining_stamina:
-                                    within_range = other_setl
-                                    attack_over_siege = False
-                                    break
+                        # If a settlement cannot be attacked, we check if the AI player can place it under siege.
+                        # Aggressive AIs will place any settlement they can see under siege, and neutral AIs will do the
+                        # same if they have the upper hand.
+                        could_siege: bool = player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE or \
+                            (player.ai_playstyle.attacking is AttackPlaystyle.NEUTRAL and
+                             unit.health >= other_setl.strength * 2)
+                        if could_attack or could_siege:
+                            targetable_setls.append((other_setl, owner, could_attack))
+                if targetable_setls:
+                    within_range, target_owner, attack_over_siege = \
+                        min(targetable_setls, key=lambda target: target[0].entity_id)
             if within_range is not None:
                 # Now that we have determined that there is some entity (unit or settlement) that our unit will attack,
                 # we need to work out where we will move our unit to. There are three options for this, directly to the
@@ -401,10 +414,9 @@ class MoveMaker:
                 found_valid_loc = False
                 # We have to ensure that no other units or settlements are in the location we intend to move to.
                 for loc in [first_resort, second_resort, third_resort]:
-                    if not any(u.location == loc for u in player.units) and \
-                            not any(other_u.location == loc for other_u in other_units) and \
-                            not any(setl.location == loc for setl in all_setls):
+                    if not self.state_ref.spatial_index.is_blocked(loc):
                         unit.location = loc
+                        self.state_ref.spatial_index.units.move(unit)
                         found_valid_loc = True
                         break
                 unit.remaining_stamina = 0
@@ -421,33 +433,33 @@ class MoveMaker:
                             data = attack(unit, within_range)
 
                             # Show the attack notification if we attacked the player.
-                            if within_range in all_players[0].units:
-                                self.board_ref.overlay.toggle_attack(data)
+                            if target_owner is all_players[0]:
+                                self.state_ref.notify(NotificationType.ATTACK, data)
                             if within_range.health <= 0:
-                                for p in all_players:
-                                    if within_range in p.units:
-                                        p.units.remove(within_range)
-                                        break
+                                target_owner.units.remove(within_range)
+                                self.state_ref.spatial_index.units.remove(within_range)
                             if unit.health <= 0:
                                 player.units.remove(unit)
+                                self.state_ref.spatial_index.units.remove(unit)
                         # Alternatively, we are attacking a settlement.
                         else:
-                            setl_owner = None
-                            for pl in all_players:
-                                if within_range in pl.settlements:
-                                    setl_owner = pl
-                            data = attack_setl(unit, within_range, setl_owner)
+                            data = attack_setl(unit, within_range, target_owner)
 
                             # Show the settlement attack notification if we attacked the player.
-                            if within_range in all_players[0].settlements:
-                                self.board_ref.overlay.toggle_setl_attack(data)
+                            if target_owner is all_players[0]:
+                                self.state_ref.notify(NotificationType.SETL_ATTACK, data)
                             if data.attacker_was_killed:
                                 player.units.remove(data.attacker)
+                                self.state_ref.spatial_index.units.remove(data.attacker)
                             elif data.setl_was_taken:
                                 data.settlement.under_siege_by = None
                                 if player.faction is not Faction.CONCENTRATED:
                                     player.settlements.append(data.settlement)
-                                setl_owner.settlements.remove(data.settlement)
+                                    self.state_ref.spatial_index.settlements.transfer(data.settlement, player)
+                                else:
+                                    # The Concentrated raze the settlements they take.
+                                    self.state_ref.spatial_index.settlements.remove(data.settlement)
+                                target_owner.settlements.remove(data.settlement)
                     # If we have chosen to place a settlement under siege, and the unit is not already sieging another
                     # settlement, do so.
                     elif not unit.sieging:
@@ -455,39 +467,109 @@ class MoveMaker:
                         if within_range.under_siege_by is None:
                             within_range.under_siege_by = unit
                             # Show the siege notification if we have placed one of the player's settlements under siege.
-                            if within_range in all_players[0].settlements:
-                                self.board_ref.overlay.toggle_siege_notif(within_range, player)
+                            if target_owner is all_players[0]:
+                                self.state_ref.notify(NotificationType.SIEGE, within_range, player)
             # If there's nothing within range, look for relics or just move randomly.
             else:
                 # The range in which a unit can investigate is actually further than its remaining stamina, as you only
                 # have to be next to a relic to investigate it.
                 investigate_range = unit.remaining_stamina + 1
-                for i in range(unit.location[1] - investigate_range, unit.location[1] + investigate_range + 1):
-                    for j in range(unit.location[0] - investigate_range, unit.location[0] + investigate_range + 1):
-                        if 0 <= i <= 89 and 0 <= j <= 99 and quads[i][j].is_relic:
-                            first_resort: (int, int)
-                            second_resort = j, i + 1
-                            third_resort = j, i - 1
-                            if j - unit.location[0] < 0:
-                                first_resort = j + 1, i
-                            else:
-                                first_resort = j - 1, i
-                            found_valid_loc = False
-                            for loc in [first_resort, second_resort, third_resort]:
-                                if not any(u.location == loc for u in player.units) and \
-                                        not any(other_u.location == loc for other_u in other_units) and \
-                                        not any(setl.location == loc for setl in all_setls):
-                                    unit.location = loc
-                                    found_valid_loc = True
-                                    break
-                            unit.remaining_stamina = 0
-                            if found_valid_loc:
-                                investigate_relic(player, unit, (j, i), cfg)
-                                quads[i][j].is_relic = False
-                                return
+                # Relics are looked up from the index, nearest first, rather than by checking every quad in range.
+                for j, i in self.state_ref.relics.get_nearby(unit.location, investigate_range):
+                    first_resort: (int, int)
+                    second_resort = j, i + 1
+                    third_resort = j, i - 1
+                    if j - unit.location[0] < 0:
+                        first_resort = j + 1, i
+                    else:
+                        first_resort = j - 1, i
+                    found_valid_loc = False
+                    for loc in [first_resort, second_resort, third_resort]:
+                        if not self.state_ref.spatial_index.is_blocked(loc):
+                            unit.location = loc
+                            self.state_ref.spatial_index.units.move(unit)
+                            found_valid_loc = True
+                            break
+                    unit.remaining_stamina = 0
+                    if found_valid_loc:
+                        investigate_relic(player, unit, (j, i), cfg, self.state_ref.rng)
+                        self.state_ref.remove_relic(j, i)
+                        # The player's other units must no longer head for the investigated relic.
+                        self.roaming_field = None
+                        return
                 # We only get to this point if a valid relic was not found.
-                x_movement = random.randint(-unit.remaining_stamina, unit.remaining_stamina)
-                rem_movement = unit.remaining_stamina - abs(x_movement)
-                y_movement = random.choice([-rem_movement, rem_movement])
-                unit.location = clamp(unit.location[0] + x_movement, 0, 99), clamp(unit.location[1] + y_movement, 0, 89)
-                unit.remaining_stamina -= abs(x_movement) + abs(y_movement)
+                self.move_towards_goal(unit, self.get_roaming_field(player))
+
+    def get_settling_field(self, player: Player) -> DistanceField:
+        """
+        Get the distance field guiding the given AI player's settlers to the nearest quad far enough away from the
+        player's settlements to found a new one, updating it for any settlements founded since it was last needed.
+        :param player: The AI player whose settlers are being moved.
+        :return: The distance field for the player's settlers.
+        """
+        setl_locs = {setl.location for setl in player.settlements}
+        previous = self.settling_fields.get(player.name)
+        if previous is not None and previous[0] <= setl_locs:
+            for location in setl_locs - previous[0]:
+                previous[1].remove_goals_near(location, SETTLEMENT_SPACING)
+            settling_field = previous[1]
+        else:
+            settling_field = DistanceField.away_from(setl_locs, SETTLEMENT_SPACING)
+        self.settling_fields[player.name] = setl_locs, settling_field
+        return settling_field
+
+    def get_roaming_field(self, player: Player) -> DistanceField:
+        """
+        Get the distance field guiding the given AI player's units when there is nothing within range for them to
+        attack or investigate, working it out if it is needed for the first time this turn. Aggressive AIs seek out
+        enemy settlements as well as relics, whereas all other AIs only seek out relics.
+        :param player: The AI player whose units are being moved.
+        :return: The distance field for the player's units.
+        """
+        if self.roaming_field is None:
+            if player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE:
+                all_setls = self.state_ref.spatial_index.settlements.query(0, 0, BOARD_WIDTH - 1, BOARD_HEIGHT - 1)
+                enemy_setl_locs = {setl.location for setl, owner in all_setls if owner is not player}
+                relic_field = self.state_ref.get_relic_field()
+                previous = self.enemy_setl_fields.get(player.name)
+                if previous is not None and previous[0] <= enemy_setl_locs:
+                    new_locs = enemy_setl_locs - previous[0]
+                    previous[1].add_goals(new_locs)
+                    enemy_setl_field = previous[1]
+                    # The combined field can be kept too, as long as the relics haven't changed since it was combined.
+                    previous_combined = self.combined_fields.get(player.name)
+                    if previous_combined is not None and previous_combined[0] is relic_field:
+                        previous_combined[1].add_goals(new_locs)
+                        self.roaming_field = previous_combined[1]
+                else:
+                    enemy_setl_field = DistanceField(enemy_setl_locs)
+                self.enemy_setl_fields[player.name] = enemy_setl_locs, enemy_setl_field
+                if self.roaming_field is None:
+                    self.roaming_field = DistanceField.nearest_of(enemy_setl_field, relic_field)
+                    self.combined_fields[player.name] = relic_field, self.roaming_field
+            else:
+                # Relics are the same for everyone, so their distance field is shared between players.
+                self.roaming_field = self.state_ref.get_relic_field()
+        return self.roaming_field
+
+    def move_towards_goal(self, unit: Unit, field: DistanceField):
+        """
+        Move the given unit as far as it can towards the nearest goal in the given distance field, or randomly if there
+        are no goals.
+        :param unit: The unit being moved.
+        :param field: The distance field to follow.
+        """
+        if field.has_goals():
+            # Units deployed or attacking at the edge of the board can find themselves just off it, so they are brought
+            # back on before heading off, as they would be by a random move.
+            start = clamp(unit.location[0], 0, BOARD_WIDTH - 1), clamp(unit.location[1], 0, BOARD_HEIGHT - 1)
+            unit.location, moves_taken = field.step_towards(start, unit.remaining_stamina,
+                                                            self.state_ref.spatial_index.is_blocked)
+            unit.remaining_stamina -= moves_taken
+        else:
+            x_movement = self.state_ref.rng.randint(-unit.remaining_stamina, unit.remaining_stamina)
+            rem_movement = unit.remaining_stamina - abs(x_movement)
+            y_movement = self.state_ref.rng.choice([-rem_movement, rem_movement])
+            unit.location = clamp(unit.location[0] + x_movement, 0, 99), clamp(unit.location[1] + y_movement, 0, 89)
+            unit.remaining_stamina -= abs(x_movement) + abs(y_movement)
+        self.state_ref.spatial_index.units.move(unit)
@@ -11,18 +11,28 @@ class MusicPlayer:
     """
     def __init__(self):
         """
-        Load in the menu and background in-game music, shuffling them and setting their volumes.
+        Load in the menu music, setting its volume, and shuffle the in-game music. The in-game music is only loaded when
+        it is first played, so that the menu can be shown as soon as possible.
         """
         self.menu_player: vlc.MediaPlayer = vlc.MediaPlayer("resources/audio/menu.aiff")
         self.menu_player.audio_set_volume(70)
         random.seed()
-        self.game_players: typing.List[vlc.MediaPlayer] = \
-            [vlc.MediaPlayer(f"resources/audio/background{i}.aiff") for i in range(1, 9)]
-        random.shuffle(self.game_players)
-        for gp in self.game_players:
-            gp.audio_set_volume(70)
+        self.game_tracks: typing.List[str] = [f"resources/audio/background{i}.aiff" for i in range(1, 9)]
+        random.shuffle(self.game_tracks)
+        # The player for each in-game track, once it has been loaded.
+        self.game_players: typing.List[typing.Optional[vlc.MediaPlayer]] = [None] * len(self.game_tracks)
         self.current_idx = 0
 
+    def get_game_player(self) -> vlc.MediaPlayer:
+        """
+        Get the player for the current in-game track, loading it and setting its volume if this is its first time.
+        :return: The player for the current track.
+        """
+        if self.game_players[self.current_idx] is None:
+            self.game_players[self.current_idx] = vlc.MediaPlayer(self.game_tracks[self.current_idx])
+            self.game_players[self.current_idx].audio_set_volume(70)
+        return self.game_players[self.current_idx]
+
     def play_menu_music(self):
         """
         Play the menu music, setting its volume first.
@@ -43,24 +53,26 @@ class MusicPlayer:
         """
         Play the current in-game music, setting its volume and restarting it first.
         """
-        self.game_players[self.current_idx].audio_set_volume(70)
-        self.game_players[self.current_idx].set_position(0)
-        self.game_players[self.current_idx].play()
+        game_player = self.get_game_player()
+        game_player.audio_set_volume(70)
+        game_player.set_position(0)
+        game_player.play()
 
     def stop_game_music(self):
         """
         Stop the in-game music, fading it out first.
         """
+        game_player = self.get_game_player()
         for vol in range(70, 0, -10):
             sleep(0.08)
-            self.game_players[self.current_idx].audio_set_volume(vol)
-        self.game_players[self.current_idx].pause()
+            game_player.audio_set_volume(vol)
+        game_player.pause()
 
     def next_song(self):
         """
         Skip to the next in-game song.
         """
-        self.game_players[self.current_idx].pause()
+        self.get_game_player().pause()
         if self.current_idx < len(self.game_players) - 1:
             self.current_idx += 1
         else:
@@ -72,4 +84,4 @@ class MusicPlayer:
         Returns whether any in-game song is playing. Used to skip to the next track if the current one has finished.
         :return: Whether an in-game song is playing.
         """
-        return any(mp.is_playing() for mp in self.game_players)
+        return any(mp.is_playing() for mp in self.game_players if mp is not None)
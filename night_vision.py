@@ -0,0 +1,76 @@
+import typing
+
+from models import Player
+from spatial_index import Entity
+
+# The number of quads in each direction that units and settlements can see at night.
+NIGHT_VISION_RANGE = 3
+
+
+class NightVision:
+    """
+    The class responsible for keeping track of the quads the non-AI player can see at night, updating them incrementally
+    as the player's units and settlements come and go, rather than recalculating them every frame.
+    """
+    def __init__(self, player: Player, width: int, height: int):
+        """
+        Initialise the vision with nothing visible.
+        :param player: The player whose vision is being tracked.
+        :param width: The width of the board, in quads.
+        :param height: The height of the board, in quads.
+        """
+        self.player: Player = player
+        self.width = width
+        self.height = height
+        # The number of the player's units and settlements that can see each quad, indexed by y * width + x.
+        self.coverage: typing.List[int] = [0] * (width * height)
+        self.visible: typing.Set[typing.Tuple[int, int]] = set()
+        # The quads that have become visible or invisible since the changes were last taken.
+        self.changed: typing.Set[typing.Tuple[int, int]] = set()
+
+    def update(self, _: Entity, owner: typing.Optional[Player],
+               old_loc: typing.Optional[typing.Tuple[int, int]], new_loc: typing.Optional[typing.Tuple[int, int]]):
+        """
+        Update the vision for an entity that was placed in or removed from a location. Registered as a listener on the
+        unit and settlement grids of the spatial index.
+        :param _: The entity that was placed or removed. Only its location matters here.
+        :param owner: The owner of the entity.
+        :param old_loc: The location the entity was removed from, if it was removed.
+        :param new_loc: The location the entity was placed in, if it was placed.
+        """
+        # Only the non-AI player's vision is ever displayed.
+        if owner is not self.player:
+            return
+        if old_loc is not None:
+            self.adjust(old_loc, -1)
+        if new_loc is not None:
+            self.adjust(new_loc, 1)
+
+    def adjust(self, location: typing.Tuple[int, int], change: int):
+        """
+        Adjust the coverage of the quads within range of the given location.
+        :param location: The location of the unit or settlement.
+        :param change: 1 if the quads are now seen by one more unit or settlement, and -1 if by one fewer.
+        """
+        for i in range(max(location[1] - NIGHT_VISION_RANGE, 0),
+                       min(location[1] + NIGHT_VISION_RANGE + 1, self.height)):
+            for j in range(max(location[0] - NIGHT_VISION_RANGE, 0),
+                           min(location[0] + NIGHT_VISION_RANGE + 1, self.width)):
+                idx = i * self.width + j
+                self.coverage[idx] += change
+                # Quads only change visibility when they gain their first viewer or lose their last one.
+                if change > 0 and self.coverage[idx] == 1:
+                    self.visible.add((j, i))
+                    self.changed.add((j, i))
+                elif change < 0 and self.coverage[idx] == 0:
+                    self.visible.discard((j, i))
+                    self.changed.add((j, i))
+
+    def take_changes(self) -> typing.Set[typing.Tuple[int, int]]:
+        """
+        Take the quads whose visibility has changed since this was last called.
+        :return: The changed quads.
+        """
+        changed = self.changed
+        self.changed = set()
+        return changed
@@ -3,6 +3,8 @@ import typing
 from models import Settlement, Player, Improvement, Unit, Blessing, CompletedConstruction, UnitPlan, Heathen, \
     AttackData, SetlAttackData, Victory, InvestigationResult, OverlayType, SettlementAttackType, PauseOption, Project, \
     ConstructionMenu
+from performance import PerformanceMonitor
+from renderer import RenderCommand
 
 
 class Overlay:
@@ -55,6 +57,17 @@ class Overlay:
         self.investigation_result: typing.Optional[InvestigationResult] = None
         self.night_beginning: bool = False
         self.settlement_status_boundaries: typing.Tuple[int, int] = 0, 7
+        # The recorded drawing of panels that only change when toggled, so that they need not be drawn in full every
+        # frame.
+        self.panel_cache: typing.Dict[OverlayType, typing.List[RenderCommand]] = {}
+        self.performance: typing.Optional[PerformanceMonitor] = None
+
+    def invalidate_panel(self, overlay_type: OverlayType):
+        """
+        Discard the recorded drawing of the given panel, so that it is drawn in full the next time it is displayed.
+        :param overlay_type: The type of the panel whose data has changed.
+        """
+        self.panel_cache.pop(overlay_type, None)
 
     """
     Note that the below methods feature some somewhat complex conditional logic in terms of which overlays may be
@@ -346,6 +359,7 @@ class Overlay:
             self.problematic_settlements = settlements
             self.has_no_blessing = no_blessing
             self.will_have_negative_wealth = will_have_negative_wealth
+            self.invalidate_panel(OverlayType.WARNING)
 
     def is_warning(self):
         """
@@ -372,6 +386,7 @@ class Overlay:
         else:
             self.showing.append(OverlayType.BLESS_NOTIF)
             self.completed_blessing = blessing
+            self.invalidate_panel(OverlayType.BLESS_NOTIF)
 
     def is_bless_notif(self):
         """
@@ -390,6 +405,7 @@ class Overlay:
         else:
             self.showing.append(OverlayType.CONSTR_NOTIF)
             self.completed_constructions = constructions
+            self.invalidate_panel(OverlayType.CONSTR_NOTIF)
 
     def is_constr_notif(self):
         """
@@ -408,6 +424,7 @@ class Overlay:
         else:
             self.showing.append(OverlayType.LEVEL_NOTIF)
             self.levelled_up_settlements = settlements
+            self.invalidate_panel(OverlayType.LEVEL_NOTIF)
 
     def is_lvl_notif(self):
         """
@@ -487,6 +504,7 @@ class Overlay:
         """
         self.showing.append(OverlayType.VICTORY)
         self.current_victory = victory
+        self.invalidate_panel(OverlayType.VICTORY)
 
     def is_victory(self):
         """
@@ -546,6 +564,7 @@ class Overlay:
             self.showing.append(OverlayType.PAUSE)
             self.pause_option = PauseOption.RESUME
             self.has_saved = False
+            self.invalidate_panel(OverlayType.PAUSE)
 
     def navigate_pause(self, down: bool):
         """
@@ -568,6 +587,7 @@ class Overlay:
                 self.has_saved = False
             elif self.pause_option is PauseOption.QUIT:
                 self.pause_option = PauseOption.CONTROLS
+        self.invalidate_panel(OverlayType.PAUSE)
 
     def is_pause(self) -> bool:
         """
@@ -602,6 +622,7 @@ class Overlay:
         else:
             self.showing.append(OverlayType.ELIMINATION)
             self.just_eliminated = eliminated
+            self.invalidate_panel(OverlayType.ELIMINATION)
 
     def is_elimination(self) -> bool:
         """
@@ -620,6 +641,7 @@ class Overlay:
         else:
             self.showing.append(OverlayType.CLOSE_TO_VIC)
             self.close_to_vics = close_to_vics
+            self.invalidate_panel(OverlayType.CLOSE_TO_VIC)
 
     def is_close_to_vic(self) -> bool:
         """
@@ -641,6 +663,7 @@ class Overlay:
                 not self.is_pause() and not self.is_controls() and not self.is_victory():
             self.showing.append(OverlayType.INVESTIGATION)
             self.investigation_result = inv_res
+            self.invalidate_panel(OverlayType.INVESTIGATION)
 
     def is_investigation(self) -> bool:
         """
@@ -659,6 +682,7 @@ class Overlay:
         else:
             self.showing.append(OverlayType.NIGHT)
             self.night_beginning = beginning
+            self.invalidate_panel(OverlayType.NIGHT)
 
     def is_night(self) -> bool:
         """
@@ -667,6 +691,24 @@ class Overlay:
         """
         return OverlayType.NIGHT in self.showing
 
+    def toggle_performance(self, performance: PerformanceMonitor):
+        """
+        Toggle the performance overlay.
+        :param performance: The monitor holding the game's performance measurements.
+        """
+        if OverlayType.PERFORMANCE in self.showing:
+            self.showing.remove(OverlayType.PERFORMANCE)
+        else:
+            self.showing.append(OverlayType.PERFORMANCE)
+            self.performance = performance
+
+    def is_performance(self) -> bool:
+        """
+        Returns whether the performance overlay is currently being displayed.
+        :return: Whether the performance overlay is being displayed.
+        """
+        return OverlayType.PERFORMANCE in self.showing
+
     def remove_layer(self) -> typing.Optional[OverlayType]:
         """
         Remove a layer of the overlay, where possible.
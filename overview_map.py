@@ -0,0 +1,117 @@
+import typing
+
+import pyxel
+
+from models import Quad, Biome, Player
+from renderer import Renderer
+from seen_quads import SeenQuads
+from spatial_index import Entity
+
+# The number of pixels wide and high that each quad is drawn as on the overview.
+OVERVIEW_SCALE = 2
+# The position on the screen at which the overview is drawn.
+OVERVIEW_X = 0
+OVERVIEW_Y = 2
+# The colour used for the see-through parts of the ownership and fog layers. No faction uses this colour.
+OVERVIEW_COLKEY = pyxel.COLOR_WHITE
+# The colour of each biome on the overview.
+BIOME_COLOURS: typing.Dict[Biome, int] = {
+    Biome.DESERT: pyxel.COLOR_PEACH,
+    Biome.FOREST: pyxel.COLOR_GREEN,
+    Biome.SEA: pyxel.COLOR_DARK_BLUE,
+    Biome.MOUNTAIN: pyxel.COLOR_GRAY
+}
+
+
+class OverviewMap:
+    """
+    The class responsible for keeping the images that make up the overview of the whole board: the biomes, which never
+    change, the settlement ownership, which changes when settlements are founded, taken, or destroyed, and the fog,
+    which only ever recedes.
+    """
+    def __init__(self, quads: typing.List[typing.List[Quad]]):
+        """
+        Render the biome of every quad, with no settlements and everything covered in fog.
+        :param quads: The 2D list of quads making up the board.
+        """
+        height = len(quads)
+        width = len(quads[0])
+        self.biomes = pyxel.Image(width * OVERVIEW_SCALE, height * OVERVIEW_SCALE)
+        self.ownership = pyxel.Image(width * OVERVIEW_SCALE, height * OVERVIEW_SCALE)
+        self.fog = pyxel.Image(width * OVERVIEW_SCALE, height * OVERVIEW_SCALE)
+        for i in range(height):
+            for j in range(width):
+                self.biomes.rect(j * OVERVIEW_SCALE, i * OVERVIEW_SCALE, OVERVIEW_SCALE, OVERVIEW_SCALE,
+                                 BIOME_COLOURS[quads[i][j].biome])
+        self.ownership.cls(OVERVIEW_COLKEY)
+        self.fog.cls(pyxel.COLOR_BLACK)
+        # The colour of the owner of each settlement on the overview, by location.
+        self.settlement_colours: typing.Dict[typing.Tuple[int, int], int] = {}
+        # The quads that have been cut out of the fog.
+        self.revealed = SeenQuads()
+
+    def update(self, _: Entity, owner: typing.Optional[Player],
+               old_loc: typing.Optional[typing.Tuple[int, int]], new_loc: typing.Optional[typing.Tuple[int, int]]):
+        """
+        Update the ownership layer for a settlement that was placed in or removed from a location. Registered as a
+        listener on the settlement grid of the spatial index.
+        :param _: The settlement that was placed or removed.
+        :param owner: The owner of the settlement.
+        :param old_loc: The location the settlement was removed from, if it was removed.
+        :param new_loc: The location the settlement was placed in, if it was placed.
+        """
+        if old_loc is not None and old_loc in self.settlement_colours:
+            del self.settlement_colours[old_loc]
+            self.ownership.rect((old_loc[0] - 1) * OVERVIEW_SCALE, (old_loc[1] - 1) * OVERVIEW_SCALE,
+                                3 * OVERVIEW_SCALE, 3 * OVERVIEW_SCALE, OVERVIEW_COLKEY)
+            # Clearing the settlement may have cleared the border of one next to it, so redraw any that are close by.
+            for loc in self.settlement_colours:
+                if abs(loc[0] - old_loc[0]) <= 2 and abs(loc[1] - old_loc[1]) <= 2:
+                    self.draw_settlement(loc)
+        if new_loc is not None and owner is not None:
+            self.settlement_colours[new_loc] = owner.colour
+            self.draw_settlement(new_loc)
+
+    def draw_settlement(self, location: typing.Tuple[int, int]):
+        """
+        Draw the settlement at the given location to the ownership layer, in its owner's colour with a black border.
+        :param location: The location of the settlement.
+        """
+        self.ownership.rect(location[0] * OVERVIEW_SCALE - 1, location[1] * OVERVIEW_SCALE - 1,
+                            OVERVIEW_SCALE + 2, OVERVIEW_SCALE + 2, pyxel.COLOR_BLACK)
+        self.ownership.rect(location[0] * OVERVIEW_SCALE, location[1] * OVERVIEW_SCALE,
+                            OVERVIEW_SCALE, OVERVIEW_SCALE, self.settlement_colours[location])
+
+    def draw(self, renderer: Renderer, map_pos: (int, int), quads_seen: typing.Optional[SeenQuads]):
+        """
+        Draw the overview of the whole board, along with the area currently in view on the main map.
+        :param renderer: The renderer to draw to.
+        :param map_pos: The current map position.
+        :param quads_seen: The quads the player has seen, or None if there is no fog to draw.
+        """
+        renderer.blt(OVERVIEW_X, OVERVIEW_Y, self.biomes, 0, 0, self.biomes.width, self.biomes.height)
+        renderer.blt(OVERVIEW_X, OVERVIEW_Y, self.ownership, 0, 0, self.ownership.width, self.ownership.height,
+                     OVERVIEW_COLKEY)
+        if quads_seen is not None:
+            # Seen quads are only ever added, so there is only work to do when the number of them has changed.
+            if len(quads_seen) != len(self.revealed):
+                for loc in quads_seen.difference(self.revealed):
+                    self.fog.rect(loc[0] * OVERVIEW_SCALE, loc[1] * OVERVIEW_SCALE, OVERVIEW_SCALE, OVERVIEW_SCALE,
+                                  OVERVIEW_COLKEY)
+                self.revealed.update(quads_seen)
+            renderer.blt(OVERVIEW_X, OVERVIEW_Y, self.fog, 0, 0, self.fog.width, self.fog.height, OVERVIEW_COLKEY)
+        # The main map shows 24 quads across and 22 down.
+        renderer.rectb(OVERVIEW_X + map_pos[0] * OVERVIEW_SCALE, OVERVIEW_Y + map_pos[1] * OVERVIEW_SCALE,
+                       24 * OVERVIEW_SCALE, 22 * OVERVIEW_SCALE, pyxel.COLOR_WHITE)
+
+    @staticmethod
+    def get_map_pos(mouse_x: int, mouse_y: int) -> (int, int):
+        """
+        Get the map position that would centre the main map on the quad clicked on in the overview.
+        :param mouse_x: The X coordinate of the mouse click.
+        :param mouse_y: The Y coordinate of the mouse click.
+        :return: The new map position, which may be slightly off-centre at the edges of the board.
+        """
+        quad_x = (mouse_x - OVERVIEW_X) // OVERVIEW_SCALE
+        quad_y = (mouse_y - OVERVIEW_Y) // OVERVIEW_SCALE
+        return max(min(quad_x - 12, 77), -1), max(min(quad_y - 11, 69), -1)
@@ -0,0 +1,222 @@
+import typing
+from functools import lru_cache
+
+# The width and height of the board, in quads.
+BOARD_WIDTH = 100
+BOARD_HEIGHT = 90
+# The distance recorded for every quad when there are no goals to reach, further than any quad can be from a goal.
+UNREACHABLE = BOARD_WIDTH * BOARD_HEIGHT
+
+
+@lru_cache(maxsize=None)
+def get_neighbours() -> typing.Tuple[typing.Tuple[int, ...], ...]:
+    """
+    Get the quads that can be moved to in a single move from each quad on the board, i.e. the up to eight quads around
+    it. Quads are identified by their index in a row-by-row list of every quad, which is much quicker to search than
+    coordinates. Only worked out the first time it is needed, and shared from then on.
+    :return: The indices of the neighbours of each quad, by the quad's index.
+    """
+    neighbours = []
+    for y in range(BOARD_HEIGHT):
+        for x in range(BOARD_WIDTH):
+            neighbours.append(tuple(ny * BOARD_WIDTH + nx
+                                    for ny in range(max(y - 1, 0), min(y + 2, BOARD_HEIGHT))
+                                    for nx in range(max(x - 1, 0), min(x + 2, BOARD_WIDTH))
+                                    if (nx, ny) != (x, y)))
+    return tuple(neighbours)
+
+
+class DistanceField:
+    """
+    The number of moves from every quad on the board to the nearest of a set of goals, e.g. relics or enemy
+    settlements. The field is calculated with a single breadth-first search outwards from every goal at once, after
+    which any number of units can find their way towards the goals by looking up the quads around them, rather than each
+    unit searching for a path of its own. The field ignores anything in the way, such as other units and settlements;
+    step_towards works around these greedily, so a unit can stop short when every quad around it closer to the goal is
+    blocked.
+    """
+    def __init__(self, goals: typing.Iterable[typing.Tuple[int, int]]):
+        """
+        Calculate the distance from every quad to the nearest of the given goals.
+        :param goals: The locations of the goals.
+        """
+        self.distances: typing.List[int] = [UNREACHABLE] * (BOARD_WIDTH * BOARD_HEIGHT)
+        self.goal_count: int = 0
+        self.add_goals(goals)
+
+    @classmethod
+    def away_from(cls, locations: typing.Iterable[typing.Tuple[int, int]], spacing: int) -> "DistanceField":
+        """
+        Calculate the distance from every quad to the nearest quad at least the given number of moves away from all of
+        the given locations, e.g. to find somewhere to found a new settlement. As most of the board is usually a goal,
+        only the quads close to the locations are searched.
+        :param locations: The locations to keep away from.
+        :param spacing: The number of moves away from the locations a quad needs to be to be a goal.
+        :return: The distance field.
+        """
+        field = cls([])
+        field.distances = [0] * (BOARD_WIDTH * BOARD_HEIGHT)
+        distances = field.distances
+        too_close: typing.List[int] = []
+        for location in locations:
+            for y in range(max(location[1] - spacing + 1, 0), min(location[1] + spacing, BOARD_HEIGHT)):
+                for x in range(max(location[0] - spacing + 1, 0), min(location[0] + spacing, BOARD_WIDTH)):
+                    idx = y * BOARD_WIDTH + x
+                    if distances[idx] == 0:
+                        distances[idx] = UNREACHABLE
+                        too_close.append(idx)
+        field.goal_count = len(distances) - len(too_close)
+        # The search starts from the quads too close to the locations that are next to a goal.
+        neighbours = get_neighbours()
+        frontier = [idx for idx in too_close if 0 in map(distances.__getitem__, neighbours[idx])]
+        for idx in frontier:
+            distances[idx] = 1
+        field.spread(frontier, 1)
+        return field
+
+    @classmethod
+    def nearest_of(cls, first: "DistanceField", second: "DistanceField") -> "DistanceField":
+        """
+        Combine the given distance fields into one leading to the nearest of all of their goals, which is much quicker
+        than searching from all of the goals again.
+        :param first: The first distance field to combine.
+        :param second: The second distance field to combine.
+        :return: The combined distance field.
+        """
+        combined = cls([])
+        combined.distances = list(map(min, first.distances, second.distances))
+        combined.goal_count = combined.distances.count(0)
+        return combined
+
+    def add_goals(self, goals: typing.Iterable[typing.Tuple[int, int]]):
+        """
+        Add the given goals to the field, updating the distance to every quad now closer to a goal. Only the quads that
+        are closer are searched, so this is much quicker than calculating the field again when goals are added.
+        :param goals: The locations of the goals to add.
+        """
+        frontier: typing.List[int] = []
+        for goal in goals:
+            idx = goal[1] * BOARD_WIDTH + goal[0]
+            if self.distances[idx] != 0:
+                self.distances[idx] = 0
+                frontier.append(idx)
+        self.goal_count += len(frontier)
+        self.spread(frontier, 0)
+
+    def copy(self) -> "DistanceField":
+        """
+        Copy the field, so that it can be updated without affecting anything calculated from the original.
+        :return: The copied distance field.
+        """
+        copied = DistanceField([])
+        copied.distances = list(self.distances)
+        copied.goal_count = self.goal_count
+        return copied
+
+    def remove_goals_near(self, location: typing.Tuple[int, int], spacing: int):
+        """
+        Stop treating the quads less than the given number of moves away from the given location as goals, e.g. around
+        a newly-founded settlement or at an investigated relic, updating the distance to every quad whose nearest goal
+        was one of them. Only the quads around the location are searched, so this is much quicker than calculating the
+        field again.
+        :param location: The location to remove the goals around.
+        :param spacing: The number of moves away from the location a quad needs to be to remain a goal.
+        """
+        neighbours = get_neighbours()
+        distances = self.distances
+        min_x, max_x = location[0] - spacing + 1, location[0] + spacing - 1
+        min_y, max_y = location[1] - spacing + 1, location[1] + spacing - 1
+        too_close = [y * BOARD_WIDTH + x
+                     for y in range(max(min_y, 0), min(max_y + 1, BOARD_HEIGHT))
+                     for x in range(max(min_x, 0), min(max_x + 1, BOARD_WIDTH))]
+        self.goal_count -= sum(distances[idx] == 0 for idx in too_close)
+        # A quad can only have been heading for one of the quads that are no longer goals if it is no further from them
+        # than from its nearest goal. Every such quad is connected to the quads too close to the location by others
+        # like it, so they are found by searching outwards from there.
+        # The quads around them that were not affected still have the right distances, so the search for the new
+        # distances starts again from these, the closest to a goal first.
+        affected = set(too_close)
+        unaffected: typing.Set[int] = set()
+        to_search = too_close
+        while to_search:
+            next_to_search = []
+            for idx in to_search:
+                for neighbour in neighbours[idx]:
+                    if neighbour not in affected and neighbour not in unaffected:
+                        x, y = neighbour % BOARD_WIDTH, neighbour // BOARD_WIDTH
+                        if distances[neighbour] >= max(min_x - x, x - max_x, min_y - y, y - max_y):
+                            affected.add(neighbour)
+                            next_to_search.append(neighbour)
+                        else:
+                            unaffected.add(neighbour)
+            to_search = next_to_search
+        for idx in affected:
+            distances[idx] = UNREACHABLE
+        edges: typing.Dict[int, typing.List[int]] = {}
+        for idx in unaffected:
+            edges.setdefault(distances[idx], []).append(idx)
+        for distance in sorted(edges):
+            self.spread(edges[distance], distance)
+
+    def spread(self, frontier: typing.List[int], distance: int):
+        """
+        Search outwards from the given quads, recording the distance to every quad not yet reached or further away.
+        :param frontier: The indices of the quads to search outwards from.
+        :param distance: The distance already recorded for the quads being searched from.
+        """
+        neighbours = get_neighbours()
+        distances = self.distances
+        # Every quad reached in one round of the search is one move further away than those reached in the round before.
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for idx in frontier:
+                for neighbour in neighbours[idx]:
+                    if distances[neighbour] > distance:
+                        distances[neighbour] = distance
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+    def has_goals(self) -> bool:
+        """
+        Returns whether there are any goals to head towards.
+        :return: Whether the field has any goals.
+        """
+        return self.goal_count > 0
+
+    def get_distance(self, location: typing.Tuple[int, int]) -> int:
+        """
+        Get the number of moves from the given location to the nearest goal.
+        :param location: The location to get the distance from.
+        :return: The distance, or UNREACHABLE if there are no goals.
+        """
+        return self.distances[location[1] * BOARD_WIDTH + location[0]]
+
+    def step_towards(self, location: typing.Tuple[int, int], moves: int,
+                     is_blocked: typing.Callable[[typing.Tuple[int, int]], bool]) -> \
+            typing.Tuple[typing.Tuple[int, int], int]:
+        """
+        Work out where a unit at the given location ends up if it heads towards the nearest goal.
+        :param location: The location the unit starts from.
+        :param moves: The most moves the unit can make.
+        :param is_blocked: A function returning whether the unit is prevented from moving to the given location, e.g.
+        by another unit or a settlement already being there.
+        :return: The location the unit ends up at, and the number of moves it took to get there. The unit stops early
+        if it reaches a goal, or if every quad around it closer to the goal is blocked.
+        """
+        neighbours = get_neighbours()
+        distances = self.distances
+        idx = location[1] * BOARD_WIDTH + location[0]
+        moves_taken = 0
+        while moves_taken < moves and distances[idx] > 0:
+            # Without anything in the way, there is always a neighbour one move closer to the goal. Other units and
+            # settlements can block the way however, in which case the unit takes the closest of the other neighbours
+            # that are still closer to the goal.
+            closer = [neighbour for neighbour in neighbours[idx]
+                      if distances[neighbour] < distances[idx] and
+                      not is_blocked((neighbour % BOARD_WIDTH, neighbour // BOARD_WIDTH))]
+            if not closer:
+                break
+            idx = min(closer, key=distances.__getitem__)
+            moves_taken += 1
+        return (idx % BOARD_WIDTH, idx // BOARD_WIDTH), moves_taken
@@ -0,0 +1,80 @@
+import time
+import typing
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+
+from renderer import RenderCommand, RenderOp
+
+# The number of frames that update and draw times are averaged over.
+ROLLING_FRAMES = 60
+
+
+class TimedPhase(Enum):
+    """
+    The longer-running parts of the game that are timed each time they occur.
+    """
+    END_TURN = "End turn"
+    HEATHENS = "Heathens"
+    AIS = "AIs"
+    SAVE = "Save"
+
+
+class PerformanceMonitor:
+    """
+    The class responsible for keeping track of how long the game spends updating and drawing, so that the cause of any
+    stutter can be seen while playing.
+    """
+    def __init__(self):
+        """
+        Initialise the monitor with nothing measured.
+        """
+        self.update_times: typing.Deque[float] = deque(maxlen=ROLLING_FRAMES)
+        self.draw_times: typing.Deque[float] = deque(maxlen=ROLLING_FRAMES)
+        # The number of blits and total commands issued for the last drawn frame.
+        self.blits: int = 0
+        self.commands: int = 0
+        # The numbers of deployed units, heathens, and settlements on the board.
+        self.entity_counts: typing.Tuple[int, int, int] = 0, 0, 0
+        # The time taken by the most recent occurrence of each phase.
+        self.phase_times: typing.Dict[TimedPhase, float] = {}
+        # Whether turns are currently being traced.
+        self.tracing: bool = False
+
+    def record_update(self, seconds: float):
+        """
+        Record the time taken by an update.
+        :param seconds: The time taken.
+        """
+        self.update_times.append(seconds)
+
+    def record_draw(self, seconds: float, commands: typing.List[RenderCommand]):
+        """
+        Record the time taken to draw a frame, and the commands drawn.
+        :param seconds: The time taken.
+        :param commands: The render commands drawn for the frame.
+        """
+        self.draw_times.append(seconds)
+        self.blits = sum(1 for command in commands if command[0] is RenderOp.BLT)
+        self.commands = len(commands)
+
+    @contextmanager
+    def measure(self, phase: TimedPhase):
+        """
+        Time the enclosed block as the given phase.
+        :param phase: The phase being timed.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[phase] = time.perf_counter() - start
+
+    @staticmethod
+    def get_average_ms(times: typing.Deque[float]) -> float:
+        """
+        Get the average of the given times, in milliseconds.
+        :param times: The times, in seconds.
+        :return: The average time in milliseconds, or 0 if there are no times.
+        """
+        return sum(times) / len(times) * 1000 if times else 0.0
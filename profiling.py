@@ -0,0 +1,93 @@
+import cProfile
+import datetime
+import os
+import pstats
+import typing
+from contextlib import contextmanager
+from enum import Enum
+
+# The number of functions listed in the text summary written alongside each profile.
+SUMMARY_LINES = 40
+# The number of drawn frames profiled each time drawing is profiled.
+PROFILED_FRAMES = 60
+
+
+class ProfileTarget(Enum):
+    """
+    The parts of the game that can be profiled on demand.
+    """
+    TURN = "turn"
+    DRAW = "draw"
+
+
+class ProfileCapture:
+    """
+    The class responsible for profiling a part of the game with cProfile once asked to, e.g. the next turn, and then
+    writing out the profile along with a summary of where the time went.
+    """
+    def __init__(self):
+        """
+        Initialise the capture with nothing to profile.
+        """
+        self.target: typing.Optional[ProfileTarget] = None
+        # The number of captures of the target left to profile before the profile is written out.
+        self.remaining: int = 0
+        self.profile: typing.Optional[cProfile.Profile] = None
+
+    def request(self, target: ProfileTarget, captures: int = 1):
+        """
+        Profile the next occurrences of the given target, replacing any profile already in progress.
+        :param target: The part of the game to profile.
+        :param captures: The number of occurrences to profile, e.g. turns or frames.
+        """
+        self.target = target
+        self.remaining = captures
+        self.profile = cProfile.Profile()
+
+    def is_requested(self, target: ProfileTarget) -> bool:
+        """
+        Returns whether the given target is waiting to be profiled.
+        :param target: The part of the game.
+        :return: Whether the target is to be profiled.
+        """
+        return self.target is target
+
+    @contextmanager
+    def capture(self, target: ProfileTarget):
+        """
+        Profile the enclosed block if the given target is waiting to be profiled.
+        :param target: The part of the game the enclosed block is.
+        """
+        if self.target is not target:
+            yield
+            return
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    def complete(self, target: ProfileTarget, directory: str) -> typing.Optional[str]:
+        """
+        Count one capture of the given target as complete, writing out the profile if it was the last one requested.
+        :param target: The part of the game that has just finished.
+        :param directory: The directory to write the profile and its summary to.
+        :return: The path of the written profile, if one was written.
+        """
+        if self.target is not target:
+            return None
+        self.remaining -= 1
+        if self.remaining > 0:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        # The ':' characters in the datestring must be replaced to conform with Windows files supported characters.
+        sanitised_timestamp = datetime.datetime.now().isoformat(timespec='seconds').replace(':', '.')
+        profile_name = os.path.join(directory, f"profile-{target.value}-{sanitised_timestamp}")
+        self.profile.dump_stats(f"{profile_name}.prof")
+        with open(f"{profile_name}.txt", "w", encoding="utf-8") as summary_file:
+            stats = pstats.Stats(self.profile, stream=summary_file)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(SUMMARY_LINES)
+        self.target = None
+        self.profile = None
+        return f"{profile_name}.prof"
@@ -0,0 +1,222 @@
+import time
+import typing
+from collections import Counter
+from enum import Enum
+
+import pyxel
+
+# The dimensions of the screen, in pixels.
+SCREEN_WIDTH = 200
+SCREEN_HEIGHT = 200
+# The dimensions of each character drawn by pyxel.text().
+CHAR_WIDTH = 4
+CHAR_HEIGHT = 6
+
+
+class RenderOp(Enum):
+    """
+    The types of drawing operation that can be recorded.
+    """
+    CLS = "CLS"
+    BLT = "BLT"
+    RECT = "RECT"
+    RECTB = "RECTB"
+    LINE = "LINE"
+    TEXT = "TEXT"
+    PAL = "PAL"
+
+
+# Each command is a tuple of its operation followed by the arguments it would be given if drawn with pyxel.
+RenderCommand = typing.Tuple[typing.Any, ...]
+
+
+class Renderer:
+    """
+    The class that drawing code draws to. Rather than drawing directly, each operation is recorded as a command in a
+    buffer, which is later replayed by a backend.
+    """
+    def __init__(self):
+        """
+        Initialise the renderer with an empty command buffer.
+        """
+        self.commands: typing.List[RenderCommand] = []
+
+    def cls(self, col: int):
+        """
+        Record a clearing of the screen.
+        :param col: The colour to clear the screen to.
+        """
+        self.commands.append((RenderOp.CLS, col))
+
+    def blt(self, x: int, y: int, img: typing.Union[int, pyxel.Image], u: int, v: int, w: int, h: int,
+            colkey: typing.Optional[int] = None):
+        """
+        Record the drawing of a section of an image.
+        :param x: The X coordinate to draw to.
+        :param y: The Y coordinate to draw to.
+        :param img: The image, or image bank, to draw from.
+        :param u: The X coordinate of the section of the image.
+        :param v: The Y coordinate of the section of the image.
+        :param w: The width of the section.
+        :param h: The height of the section.
+        :param colkey: The transparent colour, if there is one.
+        """
+        self.commands.append((RenderOp.BLT, x, y, img, u, v, w, h, colkey))
+
+    def rect(self, x: int, y: int, w: int, h: int, col: int):
+        """
+        Record the drawing of a filled rectangle.
+        :param x: The X coordinate of the rectangle.
+        :param y: The Y coordinate of the rectangle.
+        :param w: The width of the rectangle.
+        :param h: The height of the rectangle.
+        :param col: The colour of the rectangle.
+        """
+        self.commands.append((RenderOp.RECT, x, y, w, h, col))
+
+    def rectb(self, x: int, y: int, w: int, h: int, col: int):
+        """
+        Record the drawing of a rectangle's border.
+        :param x: The X coordinate of the rectangle.
+        :param y: The Y coordinate of the rectangle.
+        :param w: The width of the rectangle.
+        :param h: The height of the rectangle.
+        :param col: The colour of the border.
+        """
+        self.commands.append((RenderOp.RECTB, x, y, w, h, col))
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, col: int):
+        """
+        Record the drawing of a line.
+        :param x1: The X coordinate of the start of the line.
+        :param y1: The Y coordinate of the start of the line.
+        :param x2: The X coordinate of the end of the line.
+        :param y2: The Y coordinate of the end of the line.
+        :param col: The colour of the line.
+        """
+        self.commands.append((RenderOp.LINE, x1, y1, x2, y2, col))
+
+    def text(self, x: int, y: int, s: str, col: int):
+        """
+        Record the drawing of some text.
+        :param x: The X coordinate of the text.
+        :param y: The Y coordinate of the text.
+        :param s: The text to draw.
+        :param col: The colour of the text.
+        """
+        self.commands.append((RenderOp.TEXT, x, y, s, col))
+
+    def pal(self, col1: typing.Optional[int] = None, col2: typing.Optional[int] = None):
+        """
+        Record a swap of one colour for another in subsequent draws, or a reset of all swaps if no colours are given.
+        :param col1: The colour to swap out.
+        :param col2: The colour to swap in.
+        """
+        self.commands.append((RenderOp.PAL, col1, col2))
+
+    def extend(self, commands: typing.List[RenderCommand]):
+        """
+        Record a previously-recorded list of commands, e.g. one that has been cached for a screen that has not changed.
+        :param commands: The commands to record.
+        """
+        self.commands.extend(commands)
+
+    def take_commands(self) -> typing.List[RenderCommand]:
+        """
+        Take the recorded commands, leaving the buffer empty for the next frame.
+        :return: The commands recorded since this was last called.
+        """
+        commands = self.commands
+        self.commands = []
+        return commands
+
+
+class PyxelBackend:
+    """
+    The backend that replays recorded commands to the screen with pyxel.
+    """
+    @staticmethod
+    def replay(commands: typing.List[RenderCommand]):
+        """
+        Draw each of the given commands in order.
+        :param commands: The commands to draw.
+        """
+        for command in commands:
+            operation = command[0]
+            if operation is RenderOp.TEXT:
+                pyxel.text(*command[1:])
+            elif operation is RenderOp.BLT:
+                pyxel.blt(*command[1:])
+            elif operation is RenderOp.RECT:
+                pyxel.rect(*command[1:])
+            elif operation is RenderOp.RECTB:
+                pyxel.rectb(*command[1:])
+            elif operation is RenderOp.LINE:
+                pyxel.line(*command[1:])
+            elif operation is RenderOp.PAL:
+                # pyxel.pal() must either be given both colours or neither.
+                if command[1] is None:
+                    pyxel.pal()
+                else:
+                    pyxel.pal(command[1], command[2])
+            elif operation is RenderOp.CLS:
+                pyxel.cls(command[1])
+
+
+class HeadlessBackend:
+    """
+    The backend that draws nothing, instead counting the commands it is given and the area they cover, so that drawing
+    can be measured without a window.
+    """
+    def __init__(self):
+        """
+        Initialise the backend with nothing counted.
+        """
+        self.frames: int = 0
+        self.op_counts: typing.Counter[RenderOp] = Counter()
+        # The total number of pixels covered by all commands, which may cover the same pixels more than once.
+        self.area_drawn: int = 0
+        # The total time, in seconds, spent recording the commands for measured frames.
+        self.draw_time: float = 0.0
+
+    def measure(self, renderer: Renderer, draw: typing.Callable[[], None]):
+        """
+        Time the given draw function, which records its commands to the given renderer, and then count the commands.
+        :param renderer: The renderer being drawn to.
+        :param draw: The function that draws the frame.
+        """
+        start = time.perf_counter()
+        draw()
+        self.draw_time += time.perf_counter() - start
+        self.replay(renderer.take_commands())
+
+    def replay(self, commands: typing.List[RenderCommand]):
+        """
+        Count the given commands as one frame.
+        :param commands: The commands to count.
+        """
+        self.frames += 1
+        for command in commands:
+            operation = command[0]
+            self.op_counts[operation] += 1
+            if operation is RenderOp.BLT:
+                self.area_drawn += abs(command[6] * command[7])
+            elif operation is RenderOp.RECT:
+                self.area_drawn += command[3] * command[4]
+            elif operation is RenderOp.RECTB:
+                self.area_drawn += 2 * (command[3] + command[4])
+            elif operation is RenderOp.LINE:
+                self.area_drawn += max(abs(command[3] - command[1]), abs(command[4] - command[2])) + 1
+            elif operation is RenderOp.TEXT:
+                self.area_drawn += len(command[3]) * CHAR_WIDTH * CHAR_HEIGHT
+            elif operation is RenderOp.CLS:
+                self.area_drawn += SCREEN_WIDTH * SCREEN_HEIGHT
+
+    def get_overdraw(self) -> float:
+        """
+        Get the average number of times each pixel on the screen was drawn to per frame.
+        :return: The average overdraw, where 1.0 means the area drawn was exactly the size of the screen.
+        """
+        if self.frames == 0:
+            return 0.0
+        return self.area_drawn / (SCREEN_WIDTH * SCREEN_HEIGHT * self.frames)
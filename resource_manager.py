@@ -0,0 +1,40 @@
+import typing
+
+import pyxel
+
+# The number of image banks in each of the background resource files.
+BACKGROUNDS_PER_FILE = 3
+
+
+class ResourceManager:
+    """
+    The class responsible for loading the game's resource files once, and keeping their images resident in memory.
+    """
+    def __init__(self):
+        """
+        Load in the quads, sprites, and background images, copying each image bank into its own named image so that no
+        draw path needs to read a resource file again. Must be called after pyxel has been initialised.
+        """
+        self.quads: pyxel.Image = self.load_images("resources/quads.pyxres", 1)[0]
+        self.sprites: pyxel.Image = self.load_images("resources/sprites.pyxres", 1)[0]
+        # The six menu backgrounds are split across two files, three per file.
+        self.backgrounds: typing.List[pyxel.Image] = \
+            self.load_images("resources/background.pyxres", BACKGROUNDS_PER_FILE) + \
+            self.load_images("resources/background2.pyxres", BACKGROUNDS_PER_FILE)
+
+    @staticmethod
+    def load_images(filename: str, bank_count: int) -> typing.List[pyxel.Image]:
+        """
+        Load the image banks from the given resource file and copy them into standalone images.
+        :param filename: The path to the resource file.
+        :param bank_count: The number of image banks in the file to keep, starting from the first.
+        :return: The copied images, in bank order.
+        """
+        pyxel.load(filename, image=True, tilemap=False, sound=False, music=False)
+        images: typing.List[pyxel.Image] = []
+        for bank in range(bank_count):
+            bank_image = pyxel.image(bank)
+            image = pyxel.Image(bank_image.width, bank_image.height)
+            image.blt(0, 0, bank, 0, 0, bank_image.width, bank_image.height)
+            images.append(image)
+        return images
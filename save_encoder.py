@@ -1,6 +1,9 @@
 import dataclasses
 from json import JSONEncoder
 
+from models import Settlement
+from seen_quads import SeenQuads
+
 
 class SaveEncoder(JSONEncoder):
     """
@@ -12,12 +15,23 @@ class SaveEncoder(JSONEncoder):
         :param o: The object to JSON-ify.
         :return: The JSON representation of the object.
         """
-        # Data classes have their own dictionary representations.
+        # Settlements refer to the unit besieging them by the unit's ID, as the unit itself is saved along with the rest
+        # of its owner's units. Settlements from loaded games are ObjectConverters, which are defined below.
+        if isinstance(o, (Settlement, ObjectConverter)) and getattr(o, "under_siege_by", None) is not None:
+            setl = dict(vars(o))
+            setl["under_siege_by"] = o.under_siege_by.entity_id
+            return setl
+        # Data classes are represented by a dictionary of their fields. Only the top level is converted here, so that
+        # any data classes within them, such as settlements within players, are handled by this method too.
         if dataclasses.is_dataclass(o):
-            return dataclasses.asdict(o)
-        # Sets must be represented as lists, no real difference anyway.
+            return {field.name: getattr(o, field.name) for field in dataclasses.fields(o)}
+        # Seen quads are packed into a string of bits.
+        if isinstance(o, SeenQuads):
+            return o.pack()
+        # Sets must be represented as lists, no real difference anyway. They are sorted so that the same game is always
+        # saved the same way, whatever order the set happens to iterate in.
         if isinstance(o, set):
-            return list(o)
+            return sorted(o)
         # ObjectConvertors, which are defined below, are essentially dicts with attributes anyway, so just return their
         # dict.
         if isinstance(o, ObjectConverter):
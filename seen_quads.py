@@ -0,0 +1,98 @@
+import base64
+import typing
+
+# The dimensions of the board, in quads.
+BOARD_WIDTH = 100
+BOARD_HEIGHT = 90
+
+
+class SeenQuads:
+    """
+    The quads a player has seen, stored as one bit per quad on the board rather than as a set of coordinates.
+    """
+    def __init__(self, packed: typing.Optional[bytes] = None):
+        """
+        Initialise the grid, either with nothing seen or from previously-packed bits.
+        :param packed: The bytes of a previously-packed grid, if there is one.
+        """
+        self.bits = bytearray(packed) if packed is not None else bytearray((BOARD_WIDTH * BOARD_HEIGHT + 7) // 8)
+        # Keep a running count of the set bits so that len() is cheap.
+        self.count: int = sum(bin(byte).count("1") for byte in self.bits)
+
+    def add(self, location: typing.Tuple[int, int]):
+        """
+        Mark the quad at the given location as seen, if it is on the board.
+        :param location: The location of the quad.
+        """
+        if 0 <= location[0] < BOARD_WIDTH and 0 <= location[1] < BOARD_HEIGHT:
+            idx = location[1] * BOARD_WIDTH + location[0]
+            if not self.bits[idx >> 3] & (1 << (idx & 7)):
+                self.bits[idx >> 3] |= 1 << (idx & 7)
+                self.count += 1
+
+    def stamp(self, centre: typing.Tuple[int, int], radius: int):
+        """
+        Mark every quad in the square around the given location as seen, e.g. around a newly-deployed unit.
+        :param centre: The location at the centre of the square.
+        :param radius: The number of quads in each direction from the centre to mark.
+        """
+        min_x = max(centre[0] - radius, 0)
+        max_x = min(centre[0] + radius, BOARD_WIDTH - 1)
+        for y in range(max(centre[1] - radius, 0), min(centre[1] + radius, BOARD_HEIGHT - 1) + 1):
+            row_start = y * BOARD_WIDTH
+            for idx in range(row_start + min_x, row_start + max_x + 1):
+                if not self.bits[idx >> 3] & (1 << (idx & 7)):
+                    self.bits[idx >> 3] |= 1 << (idx & 7)
+                    self.count += 1
+
+    def update(self, other: "SeenQuads"):
+        """
+        Mark every quad seen in the other grid as seen in this one.
+        :param other: The other grid.
+        """
+        self.bits = bytearray(mine | theirs for mine, theirs in zip(self.bits, other.bits))
+        self.count = sum(bin(byte).count("1") for byte in self.bits)
+
+    def difference(self, other: "SeenQuads") -> typing.Iterator[typing.Tuple[int, int]]:
+        """
+        Find the quads seen in this grid but not in the other, skipping over any bytes that are the same in both.
+        :param other: The other grid.
+        :return: An iterator of the locations of the quads only seen in this grid.
+        """
+        for byte_idx, (mine, theirs) in enumerate(zip(self.bits, other.bits)):
+            if only_mine := mine & ~theirs:
+                for bit in range(8):
+                    if only_mine & (1 << bit):
+                        idx = byte_idx * 8 + bit
+                        yield idx % BOARD_WIDTH, idx // BOARD_WIDTH
+
+    def pack(self) -> str:
+        """
+        Pack the grid into a string suitable for a save file.
+        :return: The base64-encoded bits.
+        """
+        return base64.b64encode(bytes(self.bits)).decode("ascii")
+
+    @staticmethod
+    def unpack(packed: str) -> "SeenQuads":
+        """
+        Unpack a grid previously packed into a save file.
+        :param packed: The base64-encoded bits.
+        :return: The unpacked grid.
+        """
+        return SeenQuads(base64.b64decode(packed))
+
+    def __contains__(self, location: typing.Tuple[int, int]) -> bool:
+        if 0 <= location[0] < BOARD_WIDTH and 0 <= location[1] < BOARD_HEIGHT:
+            idx = location[1] * BOARD_WIDTH + location[0]
+            return bool(self.bits[idx >> 3] & (1 << (idx & 7)))
+        return False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> typing.Iterator[typing.Tuple[int, int]]:
+        return self.difference(SeenQuads())
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SeenQuads) and self.bits == other.bits
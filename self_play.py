@@ -0,0 +1,160 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import statistics
+import time
+import typing
+from collections import Counter
+from dataclasses import dataclass
+
+from game_state import simulate
+from metrics import NPZ_AVAILABLE
+from models import Faction, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, GameConfig, VictoryType
+
+# The maximum number of turns a game is played for before it is considered to have ended without a victory.
+DEFAULT_TURN_LIMIT = 500
+# The player counts played by default. Every faction can be played with each of these.
+DEFAULT_PLAYER_COUNTS = [2, 4, 8, 14]
+# The seed of the first game played by default. Each game is seeded with this plus its position in the list of games.
+DEFAULT_SEED = 0
+# The number of shortest and longest games listed with their seeds, so that they can be replayed.
+OUTLIERS_SHOWN = 5
+
+
+@dataclass
+class GameResult:
+    """
+    The outcome of a single self-play game, kept small so that it can be sent back from a worker process.
+    """
+    cfg: GameConfig
+    playstyle: AIPlaystyle
+    factions: typing.List[Faction]  # The factions of every player in the game.
+    turns: int
+    seed: int  # The seed the game was played with, so that it can be replayed.
+    victory_type: typing.Optional[VictoryType] = None
+    winner: typing.Optional[Faction] = None
+
+
+def play_game(job: typing.Tuple[GameConfig, AIPlaystyle, int, typing.Optional[str]]) -> GameResult:
+    """
+    Play a single game to completion. Run in a worker process.
+    :param job: The game config, the playstyle of the AI playing the faction in the config, the turn limit, and the path
+    to export the game's metrics to, if they are to be exported.
+    :return: The outcome of the game.
+    """
+    cfg, playstyle, turn_limit, metrics_path = job
+    state, victory = simulate(cfg, turn_limit, playstyle)
+    if metrics_path is not None:
+        if metrics_path.endswith(".npz"):
+            state.metrics.export_npz(metrics_path, state.players)
+        else:
+            with open(metrics_path, "w", encoding="utf-8", newline="") as metrics_file:
+                state.metrics.export_csv(metrics_file, state.players)
+    result = GameResult(cfg, playstyle, [player.faction for player in state.players], state.turn - 1, cfg.seed)
+    if victory is not None:
+        result.victory_type = victory.type
+        result.winner = victory.player.faction
+    return result
+
+
+def get_jobs(player_counts: typing.List[int], games: int, turn_limit: int, seed: int = DEFAULT_SEED,
+             metrics_dir: typing.Optional[str] = None,
+             metrics_format: str = "csv") -> typing.List[typing.Tuple[GameConfig, AIPlaystyle, int,
+                                                                     typing.Optional[str]]]:
+    """
+    Get the games to play, covering every combination of faction, playstyle, player count, and config flags.
+    :param player_counts: The player counts to play.
+    :param games: The number of games to play for each combination.
+    :param turn_limit: The maximum number of turns to play each game for.
+    :param seed: The seed of the first game. Each game is seeded with this plus its index, so that any game can be
+    replayed.
+    :param metrics_dir: The directory to export each game's metrics to, if they are to be exported.
+    :param metrics_format: The format to export metrics in, either 'csv' or 'npz'.
+    :return: The games to play, as arguments for play_game().
+    """
+    jobs = []
+    for faction, attacking, expansion, player_count, clustering, fog, climate in \
+            itertools.product(Faction, AttackPlaystyle, ExpansionPlaystyle, player_counts,
+                              (True, False), (True, False), (True, False)):
+        for _ in range(games):
+            cfg = GameConfig(player_count, faction, clustering, fog, climate, seed + len(jobs))
+            metrics_path = None
+            if metrics_dir is not None:
+                metrics_path = os.path.join(metrics_dir, f"game-{len(jobs):05d}.{metrics_format}")
+            jobs.append((cfg, AIPlaystyle(attacking, expansion), turn_limit, metrics_path))
+    return jobs
+
+
+def summarise(results: typing.List[GameResult], elapsed: float):
+    """
+    Print a summary of the victory types, game lengths, and faction win rates across the given results.
+    :param results: The outcomes of the games played.
+    :param elapsed: The time taken to play the games, in seconds.
+    """
+    print(f"Played {len(results)} games in {elapsed:.1f}s.")
+    victory_types = Counter(result.victory_type for result in results)
+    print("Victory types:")
+    for victory_type, count in victory_types.most_common():
+        name = "None (turn limit reached)" if victory_type is None else victory_type.value
+        print(f"  {name:<26}{count:>7}  {count / len(results):6.1%}")
+    lengths = [result.turns for result in results if result.victory_type is not None]
+    if lengths:
+        print(f"Game lengths (won games): mean {statistics.mean(lengths):.1f}, median {statistics.median(lengths)}, "
+              f"min {min(lengths)}, max {max(lengths)}")
+    # Win rates are measured against every game the faction appeared in, not just those it was the config faction for.
+    appearances = Counter(faction for result in results for faction in result.factions)
+    wins = Counter(result.winner for result in results if result.winner is not None)
+    print("Faction win rates:")
+    for faction in sorted(appearances, key=lambda f: wins[f] / appearances[f], reverse=True):
+        print(f"  {faction.value:<26}{wins[faction]:>7} / {appearances[faction]:<7}"
+              f"{wins[faction] / appearances[faction]:6.1%}")
+    # The shortest and longest games are the most likely to point to balance problems, so list them with everything
+    # needed to replay them.
+    by_length = sorted(results, key=lambda result: result.turns)
+    outliers = by_length if len(by_length) <= OUTLIERS_SHOWN * 2 else \
+        by_length[:OUTLIERS_SHOWN] + by_length[-OUTLIERS_SHOWN:]
+    print("Shortest and longest games:")
+    for result in outliers:
+        ending = "turn limit" if result.victory_type is None else \
+            f"{result.victory_type.value} by {result.winner.value}"
+        print(f"  seed {result.seed:<8}{result.turns:>5} turns, {ending}; {result.cfg.player_count} players, "
+              f"{result.cfg.player_faction.value} playing {result.playstyle.attacking.value}/"
+              f"{result.playstyle.expansion.value}, clustering {result.cfg.biome_clustering}, "
+              f"fog {result.cfg.fog_of_war}, climate {result.cfg.climatic_effects}")
+
+
+def main():
+    """
+    Play every combination of faction, playstyle, player count, and config flags in parallel, and summarise the results.
+    """
+    parser = argparse.ArgumentParser(description="Play AI-only games of Microcosm in parallel for balancing.")
+    parser.add_argument("--games", type=int, default=1, help="games to play for each combination")
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURN_LIMIT, help="turn limit for each game")
+    parser.add_argument("--players", type=int, nargs="+", default=DEFAULT_PLAYER_COUNTS, help="player counts to play")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="seed of the first game, with each later game using the next seed")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes to use (default: all cores)")
+    parser.add_argument("--metrics", metavar="DIR", help="export each game's per-turn metrics to this directory")
+    parser.add_argument("--metrics-format", choices=["csv", "npz"], default="csv",
+                        help="format to export metrics in (npz requires numpy)")
+    args = parser.parse_args()
+    if args.metrics_format == "npz" and not NPZ_AVAILABLE:
+        parser.error("exporting metrics as NPZ requires numpy to be installed")
+    if args.metrics is not None:
+        os.makedirs(args.metrics, exist_ok=True)
+
+    jobs = get_jobs(args.players, args.games, args.turns, args.seed, args.metrics, args.metrics_format)
+    start = time.perf_counter()
+    results = []
+    with multiprocessing.Pool(args.processes) as pool:
+        # Games vary wildly in length, so hand them out one at a time rather than in large chunks.
+        for result in pool.imap_unordered(play_game, jobs):
+            results.append(result)
+            if len(results) % 100 == 0:
+                print(f"{len(results)}/{len(jobs)} games played...", flush=True)
+    summarise(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+import typing
+
+from models import Unit, Heathen, Settlement, Player, Quad
+
+# The width and height, in quads, of each bucket in a LocationGrid or RelicIndex.
+BUCKET_SIZE = 8
+
+# Heathens, Units, and Settlements all have locations, and may or may not have an owner.
+Entity = typing.Union[Unit, Heathen, Settlement]
+# A function called whenever an entity is placed in or removed from a location in a LocationGrid. It is supplied the
+# entity, its owner, the location it was removed from (if any), and the location it was placed in (if any).
+GridListener = typing.Callable[[Entity, typing.Optional[Player],
+                                typing.Optional[typing.Tuple[int, int]], typing.Optional[typing.Tuple[int, int]]], None]
+
+
+class LocationGrid:
+    """
+    A grid of buckets holding entities by location, so that the entities in an area can be found without checking every
+    entity in the game. The grid also acts as a registry of the entities in it, so that an entity and its owner can be
+    looked up by the entity's ID.
+    """
+    def __init__(self):
+        """
+        Initialise the empty grid. Entities are keyed by their IDs, which stay the same when a game is saved and loaded.
+        """
+        self.buckets: typing.Dict[typing.Tuple[int, int],
+                                  typing.Dict[int, typing.Tuple[Entity, typing.Optional[Player]]]] = {}
+        self.locations: typing.Dict[int, typing.Tuple[int, int]] = {}
+        # The entities at each occupied location, so that what is on a given quad can be found straight away. Entities
+        # are not usually on top of one another, but nothing stops AI units from stopping on the same quad.
+        self.occupants: typing.Dict[typing.Tuple[int, int],
+                                    typing.Dict[int, typing.Tuple[Entity, typing.Optional[Player]]]] = {}
+        # Anything else that needs to know where entities are, e.g. nighttime vision.
+        self.listeners: typing.List[GridListener] = []
+
+    def add(self, entity: Entity, owner: typing.Optional[Player] = None):
+        """
+        Add the given entity to the grid at its current location.
+        :param entity: The entity to add.
+        :param owner: The owner of the entity, if it has one.
+        """
+        self.locations[entity.entity_id] = entity.location
+        bucket_loc = entity.location[0] // BUCKET_SIZE, entity.location[1] // BUCKET_SIZE
+        self.buckets.setdefault(bucket_loc, {})[entity.entity_id] = entity, owner
+        self.occupants.setdefault(entity.location, {})[entity.entity_id] = entity, owner
+        for listener in self.listeners:
+            listener(entity, owner, None, entity.location)
+
+    def remove(self, entity: Entity):
+        """
+        Remove the given entity from the grid, if it is present.
+        :param entity: The entity to remove.
+        """
+        if (location := self.locations.pop(entity.entity_id, None)) is not None:
+            bucket_loc = location[0] // BUCKET_SIZE, location[1] // BUCKET_SIZE
+            owner = self.buckets[bucket_loc].pop(entity.entity_id)[1]
+            occupants = self.occupants[location]
+            del occupants[entity.entity_id]
+            if not occupants:
+                del self.occupants[location]
+            for listener in self.listeners:
+                listener(entity, owner, location, None)
+
+    def move(self, entity: Entity):
+        """
+        Update the grid after the given entity has moved to a new location.
+        :param entity: The entity that moved.
+        """
+        if (location := self.locations.get(entity.entity_id)) is not None and location != entity.location:
+            owner = self.buckets[location[0] // BUCKET_SIZE, location[1] // BUCKET_SIZE][entity.entity_id][1]
+            self.remove(entity)
+            self.add(entity, owner)
+
+    def transfer(self, entity: Entity, new_owner: Player):
+        """
+        Change the owner of the given entity, e.g. when a settlement is taken.
+        :param entity: The entity changing hands.
+        :param new_owner: The entity's new owner.
+        """
+        if (location := self.locations.get(entity.entity_id)) is not None:
+            bucket = self.buckets[location[0] // BUCKET_SIZE, location[1] // BUCKET_SIZE]
+            old_owner = bucket[entity.entity_id][1]
+            bucket[entity.entity_id] = entity, new_owner
+            self.occupants[location][entity.entity_id] = entity, new_owner
+            for listener in self.listeners:
+                listener(entity, old_owner, location, None)
+                listener(entity, new_owner, None, location)
+
+    def clear(self):
+        """
+        Remove all entities from the grid.
+        """
+        for bucket in self.buckets.values():
+            for entity, owner in bucket.values():
+                for listener in self.listeners:
+                    listener(entity, owner, self.locations[entity.entity_id], None)
+        self.buckets.clear()
+        self.locations.clear()
+        self.occupants.clear()
+
+    def get(self, entity_id: int) -> typing.Optional[typing.Tuple[Entity, typing.Optional[Player]]]:
+        """
+        Look up the entity with the given ID.
+        :param entity_id: The ID of the entity.
+        :return: The entity along with its owner, if it is in the grid.
+        """
+        if (location := self.locations.get(entity_id)) is None:
+            return None
+        return self.buckets[location[0] // BUCKET_SIZE, location[1] // BUCKET_SIZE][entity_id]
+
+    def contains(self, entity: Entity) -> bool:
+        """
+        Returns whether the given entity is in the grid, e.g. whether a unit is still alive and deployed.
+        :param entity: The entity to look for.
+        :return: Whether the entity is in the grid.
+        """
+        return entity.entity_id in self.locations
+
+    def get_owner(self, entity: Entity) -> typing.Optional[Player]:
+        """
+        Look up the owner of the given entity.
+        :param entity: The entity to look up.
+        :return: The entity's owner, or None if it has none or is not in the grid.
+        """
+        if (entry := self.get(entity.entity_id)) is None:
+            return None
+        return entry[1]
+
+    def get_at(self, location: typing.Tuple[int, int]) -> \
+            typing.Collection[typing.Tuple[Entity, typing.Optional[Player]]]:
+        """
+        Find the entities at the given location.
+        :param location: The location to look at.
+        :return: Each entity at the location along with its owner, in the order they arrived there.
+        """
+        return self.occupants.get(location, {}).values()
+
+    def find_at(self, location: typing.Tuple[int, int],
+                owned_by: typing.Optional[typing.Callable[[typing.Optional[Player]], bool]] = None) -> \
+            typing.Optional[Entity]:
+        """
+        Find the first entity at the given location, optionally only considering those with a particular owner.
+        :param location: The location to look at.
+        :param owned_by: A function returning whether an entity with the given owner should be considered. Every entity
+        is considered if not supplied.
+        :return: The entity found, if there is one.
+        """
+        for entity, owner in self.get_at(location):
+            if owned_by is None or owned_by(owner):
+                return entity
+        return None
+
+    def is_occupied(self, location: typing.Tuple[int, int]) -> bool:
+        """
+        Returns whether there are any entities at the given location.
+        :param location: The location to look at.
+        :return: Whether the location is occupied.
+        """
+        return location in self.occupants
+
+    def query(self, min_x: int, min_y: int, max_x: int, max_y: int) -> \
+            typing.Iterator[typing.Tuple[Entity, typing.Optional[Player]]]:
+        """
+        Find the entities within the given area, inclusive of its edges.
+        :param min_x: The left edge of the area.
+        :param min_y: The top edge of the area.
+        :param max_x: The right edge of the area.
+        :param max_y: The bottom edge of the area.
+        :return: An iterator of each entity in the area along with its owner.
+        """
+        for bucket_y in range(min_y // BUCKET_SIZE, max_y // BUCKET_SIZE + 1):
+            for bucket_x in range(min_x // BUCKET_SIZE, max_x // BUCKET_SIZE + 1):
+                for entity, owner in self.buckets.get((bucket_x, bucket_y), {}).values():
+                    if min_x <= entity.location[0] <= max_x and min_y <= entity.location[1] <= max_y:
+                        yield entity, owner
+
+
+class SpatialIndex:
+    """
+    The index of where all of the deployed units, heathens, and settlements on the board are, and who owns them.
+    """
+    def __init__(self):
+        """
+        Initialise a separate grid for each type of entity.
+        """
+        self.units = LocationGrid()
+        self.heathens = LocationGrid()
+        self.settlements = LocationGrid()
+
+    def rebuild(self, players: typing.List[Player], heathens: typing.List[Heathen]):
+        """
+        Rebuild the index from scratch, e.g. when a game has been loaded.
+        :param players: The players in the game.
+        :param heathens: The heathens in the game.
+        """
+        self.units.clear()
+        self.heathens.clear()
+        self.settlements.clear()
+        for player in players:
+            for unit in player.units:
+                self.units.add(unit, player)
+            for setl in player.settlements:
+                self.settlements.add(setl, player)
+        for heathen in heathens:
+            self.heathens.add(heathen)
+
+    def is_blocked(self, location: typing.Tuple[int, int]) -> bool:
+        """
+        Returns whether a unit is prevented from moving to the given location by a deployed unit or settlement already
+        being there.
+        :param location: The location to check.
+        :return: Whether the location is blocked.
+        """
+        return self.units.is_occupied(location) or self.settlements.is_occupied(location)
+
+
+class RelicIndex:
+    """
+    The index of where the relics yet to be investigated are, so that the relics near a unit can be found without
+    checking every quad around it.
+    """
+    def __init__(self):
+        """
+        Initialise the empty index.
+        """
+        self.buckets: typing.Dict[typing.Tuple[int, int], typing.Set[typing.Tuple[int, int]]] = {}
+
+    def rebuild(self, quads: typing.List[typing.List[Quad]]):
+        """
+        Rebuild the index from scratch, e.g. when the quads have been generated or loaded.
+        :param quads: The 2D list of quads in the game.
+        """
+        self.buckets.clear()
+        for i, row in enumerate(quads):
+            for j, quad in enumerate(row):
+                if quad.is_relic:
+                    self.buckets.setdefault((j // BUCKET_SIZE, i // BUCKET_SIZE), set()).add((j, i))
+
+    def remove(self, location: typing.Tuple[int, int]):
+        """
+        Remove the relic at the given location, if there is one, e.g. once it has been investigated.
+        :param location: The location of the relic.
+        """
+        self.buckets.get((location[0] // BUCKET_SIZE, location[1] // BUCKET_SIZE), set()).discard(location)
+
+    def get_all(self) -> typing.Iterator[typing.Tuple[int, int]]:
+        """
+        Find every relic on the board.
+        :return: An iterator of the location of each relic.
+        """
+        for bucket in self.buckets.values():
+            yield from bucket
+
+    def get_nearby(self, location: typing.Tuple[int, int], distance: int) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Find the relics within the given distance of the given location, where moving diagonally counts as one.
+        :param location: The location to search around.
+        :param distance: The furthest away a relic can be.
+        :return: The location of each relic found, nearest first. Relics the same distance away are ordered from top to
+        bottom, then left to right.
+        """
+        found: typing.List[typing.Tuple[int, int]] = []
+        min_x, max_x = location[0] - distance, location[0] + distance
+        min_y, max_y = location[1] - distance, location[1] + distance
+        for bucket_y in range(max(min_y, 0) // BUCKET_SIZE, max(max_y, 0) // BUCKET_SIZE + 1):
+            for bucket_x in range(max(min_x, 0) // BUCKET_SIZE, max(max_x, 0) // BUCKET_SIZE + 1):
+                for relic in self.buckets.get((bucket_x, bucket_y), ()):
+                    if min_x <= relic[0] <= max_x and min_y <= relic[1] <= max_y:
+                        found.append(relic)
+        found.sort(key=lambda relic: (max(abs(relic[0] - location[0]), abs(relic[1] - location[1])),
+                                      relic[1], relic[0]))
+        return found
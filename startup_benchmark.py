@@ -0,0 +1,87 @@
+import time
+
+# Measured before anything else is imported, so that the time taken to import the game is included.
+PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import typing
+
+import pyxel
+
+import game
+
+# The number of times the game is started by default. Each start is in a fresh process, so nothing is already loaded.
+DEFAULT_RUNS = 5
+# The parts of starting the game that are timed individually, by the name of the module attribute that is called.
+TIMED_STEPS = ["pyxel.init", "ResourceManager", "Menu", "MusicPlayer", "Namer"]
+
+
+def measure_startup():
+    """
+    Start the game, timing each step of its initialisation, and print the timings as JSON once the first menu frame has
+    been drawn. The game is then quit straight away. Run in a child process.
+    """
+    timings: typing.Dict[str, float] = {"imports": time.perf_counter() - PROCESS_START}
+
+    def timed(name: str, func: typing.Callable) -> typing.Callable:
+        """
+        Wrap the given function so that the time spent in it is recorded.
+        :param name: The name to record the time against.
+        :param func: The function to wrap.
+        :return: The wrapped function.
+        """
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings[name] = time.perf_counter() - start
+            return result
+        return wrapper
+
+    pyxel.init = timed("pyxel.init", pyxel.init)
+    for name in TIMED_STEPS[1:]:
+        setattr(game, name, timed(name, getattr(game, name)))
+    original_draw = game.Game.draw
+
+    def draw_first_frame(self: game.Game):
+        """
+        Draw the first frame, then report the timings and quit.
+        :param self: The game being started.
+        """
+        original_draw(self)
+        timings["first frame"] = time.perf_counter() - PROCESS_START
+        print(json.dumps(timings), flush=True)
+        pyxel.quit()
+
+    game.Game.draw = draw_first_frame
+    game.Game()
+
+
+def main():
+    """
+    Start the game several times, reporting the time taken to draw the first menu frame and each step leading up to it.
+    """
+    parser = argparse.ArgumentParser(description="Time how long Microcosm takes to show its menu.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="times to start the game")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        measure_startup()
+        return
+
+    all_timings: typing.List[typing.Dict[str, float]] = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, __file__, "--child"], capture_output=True, text=True, check=True)
+        # Anything printed while the game starts up comes first, so the timings are on the last line.
+        all_timings.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    print(f"{'Step':<16}{'Median':>10}{'Min':>10}{'Max':>10}")
+    for step in ["imports"] + TIMED_STEPS + ["first frame"]:
+        times = [timings[step] * 1000 for timings in all_timings]
+        print(f"{step:<16}{statistics.median(times):>8.1f}ms{min(times):>8.1f}ms{max(times):>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
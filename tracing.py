@@ -0,0 +1,85 @@
+import json
+import time
+import typing
+from contextlib import contextmanager
+
+# The process and thread IDs that spans are recorded against. The game runs entirely on a single thread.
+TRACE_PID = 1
+TRACE_TID = 1
+
+
+class Tracer:
+    """
+    The class responsible for recording named spans of time, e.g. each player's settlements being processed at the end
+    of a turn, so that it can be seen where the time taken to process a turn goes. Spans are written out as Chrome
+    trace events, which can be viewed at chrome://tracing or in Perfetto. Tracing is off by default, and costs next to
+    nothing while it is.
+    """
+    def __init__(self):
+        """
+        Initialise the tracer with tracing off and nothing recorded.
+        """
+        self.enabled: bool = False
+        self.events: typing.List[typing.Dict[str, typing.Any]] = []
+        # Timestamps are recorded relative to when tracing was last started.
+        self.origin: float = time.perf_counter()
+
+    def start(self):
+        """
+        Start tracing, discarding any spans previously recorded.
+        """
+        self.enabled = True
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def stop(self):
+        """
+        Stop tracing, keeping the spans recorded so that they can be exported.
+        """
+        self.enabled = False
+
+    def get_timestamp(self) -> float:
+        """
+        Get the time since tracing was started, in microseconds, as trace events expect.
+        :return: The current timestamp.
+        """
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+    def begin(self, name: str, category: str, **args):
+        """
+        Begin a span. Every span begun must be ended with end(), with spans begun inside others ended first.
+        :param name: The name of the span.
+        :param category: The category of the span, e.g. 'turn' or 'ai'.
+        :param args: Any further details to record with the span, e.g. the player it is for.
+        """
+        if self.enabled:
+            self.events.append({"name": name, "cat": category, "ph": "B", "ts": self.get_timestamp(),
+                                "pid": TRACE_PID, "tid": TRACE_TID, "args": args})
+
+    def end(self):
+        """
+        End the most recently begun span that has not yet been ended.
+        """
+        if self.enabled:
+            self.events.append({"ph": "E", "ts": self.get_timestamp(), "pid": TRACE_PID, "tid": TRACE_TID})
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        """
+        Record the enclosed block as a span.
+        :param name: The name of the span.
+        :param category: The category of the span, e.g. 'turn' or 'ai'.
+        :param args: Any further details to record with the span, e.g. the player it is for.
+        """
+        self.begin(name, category, **args)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def export(self, trace_file: typing.TextIO):
+        """
+        Write the recorded spans to the given file as Chrome trace-event JSON.
+        :param trace_file: The file to write the trace to.
+        """
+        json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, trace_file)